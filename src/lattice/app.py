@@ -2,7 +2,7 @@ import sys
 from PySide6.QtWidgets import (
     QApplication, QMenu, QMainWindow, QTabWidget
 )
-from PySide6.QtCore import Qt, QMutex, QEvent, QObject, QThread
+from PySide6.QtCore import Qt, QMutex, QEvent, QObject, QThread, Slot
 from PySide6.QtGui import QAction
 import logging
 import os
@@ -43,15 +43,41 @@ class FocusClearingFilter(QObject):
     def eventFilter(self, obj, event):
         # On mouse click
         if event.type() == QEvent.MouseButtonPress:
-            widget = QApplication.widgetAt(event.globalPos())
-            if widget is None or widget.focusPolicy() == Qt.FocusPolicy.NoFocus:
-                focused_widget = QApplication.focusWidget()
-                if focused_widget is not None:
+            # Cheap check first, skip hit testing when nothing has focus
+            focused_widget = QApplication.focusWidget()
+            if focused_widget is not None:
+                widget = QApplication.widgetAt(event.globalPos())
+                if widget is None or widget.focusPolicy() == Qt.FocusPolicy.NoFocus:
                     focused_widget.clearFocus()
                     
         return super().eventFilter(obj, event)
 CLEAR_FOCUS_FILTER = FocusClearingFilter()
 
+def create_serial(port: str, baudrate: int) -> serial.Serial:
+    """
+    Create a serial port without opening it, see SerialPortOpener
+    """
+    ser = serial.Serial()
+    ser.port = port
+    ser.baudrate = baudrate
+    ser.timeout = 0.1
+    return ser
+
+# Opens serial ports on a device thread so slow or missing ports
+# don't block the GUI from showing
+class SerialPortOpener(QObject):
+    def __init__(self, ports: list[serial.Serial]):
+        super().__init__()
+        self.ports = ports
+
+    @Slot()
+    def open_ports(self):
+        for ser in self.ports:
+            try:
+                ser.open()
+            except serial.SerialException as e:
+                logger.error(f"Failed to open serial port {ser.port}: {e}")
+
 class MainAppWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -95,14 +121,15 @@ class MainAppWindow(QMainWindow):
         
         self.pressure_gauges: list[PressureGauge] = []
         self.pressure_thread = QThread()
+        pressure_ports: list[serial.Serial] = []
 
         # Populate pressure gauge list from config file
         for pressure_config in AppConfig.HARDWARE['devices']['pressure'].values():
-            ser = serial.Serial(
+            ser = create_serial(
                 port=pressure_config['serial']['port'], 
-                baudrate=pressure_config['serial']['baudrate'],
-                timeout=0.1
+                baudrate=pressure_config['serial']['baudrate']
                 )
+            pressure_ports.append(ser)
             
             mutex = QMutex()
             
@@ -115,7 +142,10 @@ class MainAppWindow(QMainWindow):
                     worker_thread=self.pressure_thread,
                     ))
 
-        # Start the pressure thread event loop
+        # Open ports and start the pressure thread event loop
+        self.pressure_port_opener = SerialPortOpener(pressure_ports)
+        self.pressure_port_opener.moveToThread(self.pressure_thread)
+        self.pressure_thread.started.connect(self.pressure_port_opener.open_ports)
         self.pressure_thread.start()
         
         ################
@@ -123,20 +153,23 @@ class MainAppWindow(QMainWindow):
         ################
         
         self.sources: list[Source] = []
-        self.source_thread = QThread()
+        self.source_threads: list[QThread] = []
         
         if AppConfig.PARAMETER['sources']['safety'] is None:
             AppConfig.PARAMETER['sources']['safety'] = {}
         safety_settings = AppConfig.PARAMETER['sources']['safety']
         for source_config in AppConfig.HARDWARE['devices']['sources'].values():
-            logger.debug(source_config)
-            logger.debug(source_config['serial']['port'])
+            logger.debug("Source config for port %s: %s", source_config['serial']['port'], source_config)
             client = ModbusClient(
                 port=source_config['serial']['port'], 
                 baudrate=source_config['serial']['baudrate'],
                 timeout=0.1
                 )
             mutex = QMutex()
+
+            # One thread per port so a slow bus does not hold up the others
+            thread = QThread()
+            self.source_threads.append(thread)
             
             for device in source_config['connections']:
                 self.sources.append(Source(
@@ -146,11 +179,12 @@ class MainAppWindow(QMainWindow):
                     safety_settings=safety_settings.get(device['name'], {}),
                     client=client,
                     serial_mutex=mutex,
-                    worker_thread=self.source_thread
+                    worker_thread=thread
                     ))
 
-        # Start the source thread event loop
-        self.source_thread.start()
+        # Start the source thread event loops
+        for thread in self.source_threads:
+            thread.start()
         
         #################
         # SHUTTER SETUP #
@@ -158,13 +192,14 @@ class MainAppWindow(QMainWindow):
         
         self.shutters: list[Shutter] = []
         self.shutter_thread = QThread()
+        shutter_ports: list[serial.Serial] = []
         
         for shutter_config in AppConfig.HARDWARE['devices']['shutters'].values():
-            ser = serial.Serial(
+            ser = create_serial(
                 port=shutter_config['serial']['port'], 
-                baudrate=shutter_config['serial']['baudrate'],
-                timeout=0.1
+                baudrate=shutter_config['serial']['baudrate']
                 )
+            shutter_ports.append(ser)
             
             serial_mutex = QMutex()
             
@@ -176,7 +211,10 @@ class MainAppWindow(QMainWindow):
                 worker_thread=self.shutter_thread,
                 ) for shutter in shutter_config['connections']])
             
-        # Start the shutter thread event loop
+        # Open ports and start the shutter thread event loop
+        self.shutter_port_opener = SerialPortOpener(shutter_ports)
+        self.shutter_port_opener.moveToThread(self.shutter_thread)
+        self.shutter_thread.started.connect(self.shutter_port_opener.open_ports)
         self.shutter_thread.start()
         
         ##############
@@ -1,13 +1,73 @@
 import sys
 import os
+import textwrap
+from collections import defaultdict
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTableWidget, QTableWidgetItem,
-    QStackedWidget, QHeaderView, QMenu, QSpinBox
+    QPushButton, QTableView, QStackedWidget, QHeaderView, QMenu, QSpinBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 import yaml
 
+# Local imports
+from lattice.utils.config import SafeLoader, SafeDumper
+
+
+class DeviceTableModel(QAbstractTableModel):
+    """
+    Editable table model over a list of device dicts, one column per key.
+    Cell values are stored as text, forms convert them when collecting data.
+    """
+
+    def __init__(self, headers: list[str], keys: list[str]):
+        super().__init__()
+        self.headers = headers
+        self.keys = keys
+        self.rows: list[dict[str, str]] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self.rows[index.row()][self.keys[index.column()]]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self.rows[index.row()][self.keys[index.column()]] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def append_row(self, row: dict[str, str]):
+        self.append_rows([row])
+
+    def append_rows(self, rows: list[dict[str, str]]):
+        # Insert all rows with a single notification to attached views
+        if not rows:
+            return
+        position = len(self.rows)
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def remove_row(self, position: int):
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self.rows[position]
+        self.endRemoveRows()
+
 
 class PressureForm(QWidget):
     def __init__(self, on_next, initial_data=None):
@@ -21,8 +81,12 @@ class PressureForm(QWidget):
         label.setStyleSheet("font-weight: bold; font-size: 16px;")
         self.layout.addWidget(label)
 
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["Name", "Address", "Port"])
+        self.model = DeviceTableModel(
+            headers=["Name", "Address", "Port"],
+            keys=["name", "address", "port"]
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
@@ -44,41 +108,30 @@ class PressureForm(QWidget):
             self.load_data(initial_data)
 
     def add_row(self):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(""))
-        self.table.setItem(row, 1, QTableWidgetItem("0"))
-        self.table.setItem(row, 2, QTableWidgetItem("COM100"))
+        self.model.append_row({"name": "", "address": "0", "port": "COM100"})
 
     def collect_data(self):
         devices = []
-        for row in range(self.table.rowCount()):
-            # Skip rows where name or port is None (empty)
-            if self.table.item(row, 0) is None or self.table.item(row, 2) is None:
-                continue
-            name = self.table.item(row, 0).text()
-            address_text = self.table.item(row, 1).text()
-            port = self.table.item(row, 2).text()
+        for row in self.model.rows:
+            name = row["name"]
+            # Ports repeat across many rows and key the baud rate lookups
+            port = sys.intern(row["port"])
+            # Skip rows where name or port is empty
             if not name or not port:
                 continue
-            try:
-                address = address_text
-            except ValueError:
-                address = 0
             devices.append({
                 "name": name,
-                "address": address,
+                "address": row["address"],
                 "port": port
             })
         self.on_next(devices)
 
     def load_data(self, data):
-        for dev in data:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(dev.get("name", "")))
-            self.table.setItem(row, 1, QTableWidgetItem(str(dev.get("address", 0))))
-            self.table.setItem(row, 2, QTableWidgetItem(dev.get("port", "COM100")))
+        self.model.append_rows([{
+            "name": dev.get("name", ""),
+            "address": str(dev.get("address", 0)),
+            "port": dev.get("port", "COM100")
+        } for dev in data])
 
     def show_context_menu(self, position):
         index = self.table.indexAt(position)
@@ -86,7 +139,7 @@ class PressureForm(QWidget):
             menu = QMenu(self)
             delete_action = menu.addAction("Delete Row")
             if menu.exec(self.table.mapToGlobal(position)) == delete_action:
-                self.table.removeRow(index.row())
+                self.model.remove_row(index.row())
 
 
 class SourcesForm(QWidget):
@@ -102,10 +155,12 @@ class SourcesForm(QWidget):
         label.setStyleSheet("font-weight: bold; font-size: 16px;")
         self.layout.addWidget(label)
 
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels([
-            "Name", "Device ID", "Address Set", "Port", "Shutter Address", "Shutter Port"
-        ])
+        self.model = DeviceTableModel(
+            headers=["Name", "Device ID", "Address Set", "Port", "Shutter Address", "Shutter Port"],
+            keys=["name", "device_id", "address_set", "port", "shutter_address", "shutter_port"]
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
@@ -131,42 +186,36 @@ class SourcesForm(QWidget):
             self.load_data(initial_data)
 
     def add_row(self):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        self.table.setItem(row, 0, QTableWidgetItem(""))         # Name
-        self.table.setItem(row, 1, QTableWidgetItem("1"))        # Device ID
-        self.table.setItem(row, 2, QTableWidgetItem("loop_1"))   # Address Set
-        self.table.setItem(row, 3, QTableWidgetItem("COM100"))    # Port
-        self.table.setItem(row, 4, QTableWidgetItem("0"))        # Shutter Address
-        self.table.setItem(row, 5, QTableWidgetItem("COM100"))     # Shutter Port
+        self.model.append_row({
+            "name": "",
+            "device_id": "1",
+            "address_set": "loop_1",
+            "port": "COM100",
+            "shutter_address": "0",
+            "shutter_port": "COM100"
+        })
 
     def collect_data(self):
         devices = []
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0) is None:
-                continue  # skip empty rows
-            name = self.table.item(row, 0).text()
+        for row in self.model.rows:
+            name = row["name"]
             if not name:
-                continue
+                continue  # skip empty rows
             try:
-                device_id = int(self.table.item(row, 1).text())
-            except (ValueError, AttributeError):
+                device_id = int(row["device_id"])
+            except ValueError:
                 device_id = 1
-            address_set = self.table.item(row, 2).text() if self.table.item(row, 2) else "loop_1"
-            port = self.table.item(row, 3).text() if self.table.item(row, 3) else "COM100"
             try:
-                shutter_address = int(self.table.item(row, 4).text())
-            except (ValueError, AttributeError):
+                shutter_address = int(row["shutter_address"])
+            except ValueError:
                 shutter_address = 0
-            shutter_port = self.table.item(row, 5).text() if self.table.item(row, 5) else "COM100"
             devices.append({
                 "name": name,
                 "device_id": device_id,
-                "address_set": address_set,
-                "port": port,
+                "address_set": sys.intern(str(row["address_set"])),
+                "port": sys.intern(row["port"]),
                 "shutter_address": shutter_address,
-                "shutter_port": shutter_port,
+                "shutter_port": sys.intern(row["shutter_port"]),
             })
         return devices
 
@@ -178,15 +227,14 @@ class SourcesForm(QWidget):
         self.back_callback(self.collect_data())
 
     def load_data(self, data):
-        for device in data:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(device.get("name", "")))
-            self.table.setItem(row, 1, QTableWidgetItem(str(device.get("device_id", 1))))
-            self.table.setItem(row, 2, QTableWidgetItem(device.get("address_set", "loop_1")))
-            self.table.setItem(row, 3, QTableWidgetItem(device.get("port", "COM100")))
-            self.table.setItem(row, 4, QTableWidgetItem(str(device.get("shutter_address", 0))))
-            self.table.setItem(row, 5, QTableWidgetItem(device.get("shutter_port", "COM100")))
+        self.model.append_rows([{
+            "name": device.get("name", ""),
+            "device_id": str(device.get("device_id", 1)),
+            "address_set": device.get("address_set", "loop_1"),
+            "port": device.get("port", "COM100"),
+            "shutter_address": str(device.get("shutter_address", 0)),
+            "shutter_port": device.get("shutter_port", "COM100")
+        } for device in data])
 
     def show_context_menu(self, position):
         index = self.table.indexAt(position)
@@ -194,7 +242,7 @@ class SourcesForm(QWidget):
             menu = QMenu(self)
             delete_action = menu.addAction("Delete Row")
             if menu.exec(self.table.mapToGlobal(position)) == delete_action:
-                self.table.removeRow(index.row())
+                self.model.remove_row(index.row())
 
 
 class BaudRateForm(QWidget):
@@ -219,7 +267,7 @@ class BaudRateForm(QWidget):
 
         # Centered port input fields
         self.inputs = {}
-        for port in sorted(ports):
+        for port in ports:
             row = QHBoxLayout()
             row.addStretch(1)
 
@@ -260,9 +308,11 @@ class BaudRateForm(QWidget):
         button_layout.addStretch(1)
         main_layout.addLayout(button_layout)
 
+    def get_baudrates(self):
+        return {port: spin.value() for port, spin in self.inputs.items()}
+
     def generate_yaml(self):
-        baudrates = {port: spin.value() for port, spin in self.inputs.items()}
-        self.on_finish(baudrates)
+        self.on_finish(self.get_baudrates())
 
 
 class ConfiguratorWindow(QWidget):
@@ -277,6 +327,11 @@ class ConfiguratorWindow(QWidget):
         self.sources_data = []
         self.baudrates = {}
 
+        # Later steps are created on first use and reused after that
+        self.sources_form = None
+        self.baud_form = None
+        self.baud_form_ports = None
+
         self.pressure_form = PressureForm(self.on_pressure_done)
         self.stack.addWidget(self.pressure_form)
         self.stack.setCurrentWidget(self.pressure_form)
@@ -289,7 +344,7 @@ class ConfiguratorWindow(QWidget):
         if os.path.exists(config_path):
             try:
                 with open(config_path, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=SafeLoader)
 
                 if not data or 'devices' not in data:
                     return  # no devices key, nothing to load
@@ -307,6 +362,7 @@ class ConfiguratorWindow(QWidget):
                     for port, info in pressure_devices.items():
                         if not isinstance(info, dict):
                             continue
+                        port = sys.intern(str(port))
                         connections = info.get('connections', [])
                         for conn in connections:
                             if not isinstance(conn, dict):
@@ -321,56 +377,58 @@ class ConfiguratorWindow(QWidget):
                         if baud is not None:
                             self.baudrates[port] = baud
 
-                # Load sources devices
-                sources_devices = devices.get('sources', {})
-                if isinstance(sources_devices, dict):
-                    for port, info in sources_devices.items():
+                # Load shutters devices first so they can be merged
+                # into sources_data as sources are parsed
+                shutters_devices = devices.get('shutters', {})
+                shutters_info = {}
+                shutter_baudrates = {}
+                if isinstance(shutters_devices, dict):
+                    for port, info in shutters_devices.items():
                         if not isinstance(info, dict):
                             continue
+                        port = sys.intern(str(port))
                         connections = info.get('connections', [])
                         for conn in connections:
                             if not isinstance(conn, dict):
                                 continue
-                            self.sources_data.append({
-                                "name": conn.get('name', ""),
-                                "device_id": conn.get('device_id', 1),
-                                "address_set": conn.get('address_set', "loop_1"),
-                                "port": port,
-                                "shutter_address": 0,
-                                "shutter_port": ""
-                            })
+                            name = conn.get('name')
+                            if name:
+                                shutters_info[name] = (conn.get('address', 0), port)
                         # Save baudrate for port
                         baud = info.get('serial', {}).get('baudrate')
                         if baud is not None:
-                            self.baudrates[port] = baud
+                            shutter_baudrates[port] = baud
 
-                # Load shutters devices and merge into sources_data
-                shutters_devices = devices.get('shutters', {})
-                shutters_info = {}
-                if isinstance(shutters_devices, dict):
-                    for port, info in shutters_devices.items():
+                # Load sources devices, matching shutters by name
+                sources_devices = devices.get('sources', {})
+                no_shutter = (0, "")
+                if isinstance(sources_devices, dict):
+                    for port, info in sources_devices.items():
                         if not isinstance(info, dict):
                             continue
+                        port = sys.intern(str(port))
                         connections = info.get('connections', [])
                         for conn in connections:
                             if not isinstance(conn, dict):
                                 continue
-                            name = conn.get('name')
-                            if name:
-                                shutters_info[name] = {
-                                    "shutter_address": conn.get('address', 0),
-                                    "shutter_port": port
-                                }
+                            name = conn.get('name', "")
+                            shutter_address, shutter_port = shutters_info.get(name, no_shutter)
+                            self.sources_data.append({
+                                "name": name,
+                                "device_id": conn.get('device_id', 1),
+                                "address_set": conn.get('address_set', "loop_1"),
+                                "port": port,
+                                "shutter_address": shutter_address,
+                                "shutter_port": shutter_port
+                            })
                         # Save baudrate for port
                         baud = info.get('serial', {}).get('baudrate')
                         if baud is not None:
                             self.baudrates[port] = baud
 
-                # Merge shutters info back into sources_data by matching name
-                for src in self.sources_data:
-                    shutter = shutters_info.get(src['name'], {})
-                    src['shutter_address'] = shutter.get('shutter_address', 0)
-                    src['shutter_port'] = shutter.get('shutter_port', "")
+                # Shutter port baud rates take precedence, as they did when
+                # shutters were parsed after sources
+                self.baudrates.update(shutter_baudrates)
 
                 # Load data into pressure form
                 self.pressure_form.load_data(self.pressure_data)
@@ -378,15 +436,17 @@ class ConfiguratorWindow(QWidget):
             except Exception as e:
                 print(f"Failed to load config: {e}")
 
-
     def on_pressure_done(self, pressure_devices):
         self.pressure_data = pressure_devices
-        self.sources_form = SourcesForm(
-            on_next=self.on_sources_done,
-            on_back=self.on_pressure_back,
-            initial_data=self.sources_data
-        )
-        self.stack.addWidget(self.sources_form)
+        
+        # The sources form keeps its own rows between visits
+        if self.sources_form is None:
+            self.sources_form = SourcesForm(
+                on_next=self.on_sources_done,
+                on_back=self.on_pressure_back,
+                initial_data=self.sources_data
+            )
+            self.stack.addWidget(self.sources_form)
         self.stack.setCurrentWidget(self.sources_form)
 
     def on_pressure_back(self, sources_devices):
@@ -397,27 +457,41 @@ class ConfiguratorWindow(QWidget):
     def on_sources_done(self, sources_devices):
         self.sources_data = sources_devices
 
-        unique_ports = set(d['port'] for d in self.pressure_data)
-        for dev in sources_devices:
-            unique_ports.add(dev['port'])
-            if dev['shutter_port']:
-                unique_ports.add(dev['shutter_port'])
-
-        self.baud_form = BaudRateForm(
-            ports=unique_ports,
-            on_finish=self.on_baudrates_done,
-            on_back=self.on_sources_back,
-            initial_data=self.baudrates
-        )
-        self.stack.addWidget(self.baud_form)
+        # Ports in the order they were first entered, without duplicates
+        unique_ports = list(dict.fromkeys(self._iter_ports()))
+
+        # Only rebuild the baud rate form if the ports or their order changed
+        if self.baud_form is not None and unique_ports != self.baud_form_ports:
+            # Keep values entered for ports that are still in use
+            self.baudrates.update(self.baud_form.get_baudrates())
+            self.stack.removeWidget(self.baud_form)
+            self.baud_form.deleteLater()
+            self.baud_form = None
+
+        if self.baud_form is None:
+            self.baud_form = BaudRateForm(
+                ports=unique_ports,
+                on_finish=self.on_baudrates_done,
+                on_back=self.on_sources_back,
+                initial_data=self.baudrates
+            )
+            self.baud_form_ports = unique_ports
+            self.stack.addWidget(self.baud_form)
         self.stack.setCurrentWidget(self.baud_form)
 
+    def _iter_ports(self):
+        for dev in self.pressure_data:
+            yield dev['port']
+        for dev in self.sources_data:
+            yield dev['port']
+            if dev['shutter_port']:
+                yield dev['shutter_port']
+
     def on_sources_back(self):
         self.stack.setCurrentWidget(self.sources_form)
 
     def on_baudrates_done(self, baudrates):
         self.baudrates = baudrates
-        yaml_data = self.build_yaml()
 
         config_dir = os.path.join(os.path.dirname(__file__), "config")
         if not os.path.exists(config_dir):
@@ -426,66 +500,59 @@ class ConfiguratorWindow(QWidget):
 
         try:
             with open(file_path, 'w') as f:
-                yaml.dump(yaml_data, f, sort_keys=False)
+                self.write_yaml(f)
             print(f"Config saved to {file_path}")
         except Exception as e:
             print(f"Failed to save config: {e}")
 
-    def build_yaml(self):
-        result = {'devices': {}}  # Regular dict instead of defaultdict
-
-        # Pressure
+    def write_yaml(self, f):
+        """
+        Writes the hardware config to f one port entry at a time rather than
+        building the whole nested document before dumping it
+        """
+        sections = [(name, by_port) for name, by_port in self.group_devices() if by_port]
+        if not sections:
+            f.write("devices: {}\n")
+            return
+
+        f.write("devices:\n")
+        for name, by_port in sections:
+            f.write(f"  {name}:\n")
+            for port, connections in by_port.items():
+                entry = yaml.dump({port: self._port_entry(port, connections)}, Dumper=SafeDumper, sort_keys=False)
+                f.write(textwrap.indent(entry, "    "))
+
+    def group_devices(self):
+        # Group device connections by port once, in a single pass per form
+        pressure_by_port = defaultdict(list)
         for dev in self.pressure_data:
-            port = dev['port']
-            result['devices'].setdefault('pressure', {})  # Ensure 'pressure' exists
-            result['devices']['pressure'].setdefault(port, {
-                'serial': {
-                    'port': port,
-                    'baudrate': self.baudrates.get(port, 9600)
-                },
-                'connections': []
-            })
-            result['devices']['pressure'][port]['connections'].append({
-                'name': dev['name'],
-                'address': dev['address']
-            })
+            pressure_by_port[dev['port']].append({'name': dev['name'], 'address': dev['address']})
 
-        # Sources and Shutters
+        sources_by_port = defaultdict(list)
+        shutters_by_port = defaultdict(list)
         for dev in self.sources_data:
-            port = dev['port']
-            shutter_port = dev['shutter_port']
-
-            # Sources
-            result['devices'].setdefault('sources', {})  # Ensure 'sources' exists
-            result['devices']['sources'].setdefault(port, {
-                'serial': {
-                    'port': port,
-                    'baudrate': self.baudrates.get(port, 9600)
-                },
-                'connections': []
-            })
-            result['devices']['sources'][port]['connections'].append({
-                'name': dev['name'],
-                'device_id': dev['device_id'],
-                'address_set': dev['address_set']
-            })
-
-            # Shutters
-            if shutter_port:
-                result['devices'].setdefault('shutters', {})  # Ensure 'shutters' exists
-                result['devices']['shutters'].setdefault(shutter_port, {
-                    'serial': {
-                        'port': shutter_port,
-                        'baudrate': self.baudrates.get(shutter_port, 9600)
-                    },
-                    'connections': []
-                })
-                result['devices']['shutters'][shutter_port]['connections'].append({
-                    'name': dev['name'],
-                    'address': dev['shutter_address']
-                })
-
-        return result
+            sources_by_port[dev['port']].append(
+                {'name': dev['name'], 'device_id': dev['device_id'], 'address_set': dev['address_set']}
+            )
+            if dev['shutter_port']:
+                shutters_by_port[dev['shutter_port']].append(
+                    {'name': dev['name'], 'address': dev['shutter_address']}
+                )
+
+        return [
+            ('pressure', pressure_by_port),
+            ('sources', sources_by_port),
+            ('shutters', shutters_by_port),
+        ]
+
+    def _port_entry(self, port, connections):
+        return {
+            'serial': {
+                'port': port,
+                'baudrate': self.baudrates.get(port, 9600)
+            },
+            'connections': connections
+        }
     
 def start():
     app = QApplication(sys.argv)
@@ -1,5 +1,6 @@
 import random
 import logging
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -8,10 +9,10 @@ class MockSerialDevice():
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
-        self.buffer: list[bytes] = []
+        self.buffer: deque[bytes] = deque()
         
     def reset_input_buffer(self):
-        self.buffer = []
+        self.buffer.clear()
     
     def reset_output_buffer(self):
         pass
@@ -29,16 +30,28 @@ class MockSerialDevice():
         raise NotImplementedError("This method must be implemented!")
     
     def readline(self) -> bytes | None:
-        if len(self.buffer) > 0:
-            return self.buffer.pop(0)
+        if self.buffer:
+            return self.buffer.popleft()
         
         return None
     
+# Acknowledgements are discarded by host but should be included
+# to ensure they are discarded
+ACK_TURNED_ON = b"I turned on!"
+ACK_TURNED_OFF = b"I turned off!"
+
 class MockPressureGauge(MockSerialDevice):
     def __init__(self, port: str, baudrate: int, timeout: float):
         super().__init__(port, baudrate, timeout)
-        self.is_on: dict[bool] = {}
+        self.is_on: dict[bytes, bool] = {}
         self.addresses: list[str] = []
+
+        # Command handlers keyed by opcode
+        self.handlers = {
+            b"0031": self._turn_on,
+            b"0030": self._turn_off,
+            b"0002": self._query_pressure,
+        }
     
     def write(self, msg: bytes):
         """
@@ -47,46 +60,31 @@ class MockPressureGauge(MockSerialDevice):
         Turn off       - #0030{address}\r\n | ex. #0030T1\r\n
         Query pressure - #0002{address}\r\n | ex. #0002T1\r\n
         """
-        
-        # Decode msg
-        msg = msg.decode('utf-8', errors='ignore').strip()
+        msg = msg.strip()
         
         # Basic validation
-        if len(msg) < 6:
+        if len(msg) < 7 or msg[:1] != b"#":
             return
         
-        # Trim leading #
-        msg = msg[1:]
-        
-        # Store address
-        address = msg[4:6]
-        
-        # Handle turn on and off
-        if msg[0:3] == "003":
-            if msg[3] == "1":
-                logger.debug("Mock pressure gauge turning on...")
-                self.is_on[address] = True
-                # This is discarded by host but should be included
-                # to ensure it is discarded
-                self.buffer.append("I turned on!".encode('utf-8'))
-                return
-            
-            if msg[3] == "0":
-                logger.debug("Mock pressure gauge turning off...")
-                self.is_on[address] = False
-                # This is discarded by host but should be included
-                # to ensure it is discarded
-                self.buffer.append("I turned off!".encode('utf-8')) 
-                return
-        
-        # Don't handle any other type of query if the device is not on or not registered
-        if address not in self.is_on:
+        # Opcode follows leading #, address follows opcode
+        handler = self.handlers.get(msg[1:5])
+        if handler is not None:
+            handler(msg[5:7])
+
+    def _turn_on(self, address: bytes):
+        logger.debug("Mock pressure gauge turning on...")
+        self.is_on[address] = True
+        self.buffer.append(ACK_TURNED_ON)
+
+    def _turn_off(self, address: bytes):
+        logger.debug("Mock pressure gauge turning off...")
+        self.is_on[address] = False
+        self.buffer.append(ACK_TURNED_OFF)
+
+    def _query_pressure(self, address: bytes):
+        # Don't respond if the device is not on or not registered
+        if not self.is_on.get(address, False):
             return
         
-        if not self.is_on[address]:
-            return
-            
-        # Handle pressure query
-        if msg[0:4] == "0002":
-            pressure = f">{random.uniform(0, 1000):.3e}"
-            self.buffer.append(pressure.encode('utf-8'))
\ No newline at end of file
+        pressure = f">{random.uniform(0, 1000):.3e}"
+        self.buffer.append(pressure.encode('utf-8'))
\ No newline at end of file
@@ -1,4 +1,4 @@
-from PySide6.QtCore import Signal, QMutex, QObject, Slot, QTimer, QThread
+from PySide6.QtCore import Signal, QMutex, QMutexLocker, QObject, Slot, QTimer, QThread
 import time
 import serial
 import re
@@ -95,94 +95,66 @@ class PressureGaugeWorker(QObject):
         self.ser_buffer = ""
         
         self.serial_mutex = serial_mutex
-        self.data_mutex = QMutex()
         
         self.is_polling = False
         self.polling_interval_ms = 1000
         
     def send_command(self, cmd) -> str:
         """Send a message to the serial port."""
-        self.serial_mutex.lock()
-        try: 
-            if self.ser and self.ser.is_open:
-                # Clear buffers
-                self.ser.reset_input_buffer()
+        with QMutexLocker(self.serial_mutex):
+            try: 
+                if self.ser and self.ser.is_open:
+                    # Clear buffers
+                    self.ser.reset_input_buffer()
                 
-                self.ser.write(f"{cmd}\r\n".encode('utf-8'))
-                self.ser.flush()
-                time.sleep(0.01)
+                    self.ser.write(f"{cmd}\r\n".encode('utf-8'))
+                    self.ser.flush()
+                    time.sleep(0.01)
                 
-                self.data_mutex.lock()
-                self.new_serial_data.emit(f"O: {cmd}")
-                self.data_mutex.unlock()
+                    self.new_serial_data.emit(f"O: {cmd}")
                 
-                response = self.ser.readline()
-                if response:
-                    message = response.decode('utf-8', errors='ignore').strip()
-                    return message
+                    response = self.ser.readline()
+                    if response:
+                        message = response.decode('utf-8', errors='ignore').strip()
+                        return message
                 
-                return None
-
-        except Exception as e:
-            self.data_mutex.lock()
-            logger.exception(f"Error in sending serial data on port {self.ser.port}: {e}")
-            self.data_mutex.unlock()
-        finally:
-            self.serial_mutex.unlock()
+                    return None
+
+            except Exception as e:
+                logger.exception(f"Error in sending serial data on port {self.ser.port}: {e}")
     
     @Slot()
     def toggle_on_off(self):
         logger.debug(f"Worker running in {QThread.currentThread()}!")
 
-        self.data_mutex.lock()
-        is_on = self.is_on
-        address = self.address
-        name = self.name
-        self.data_mutex.unlock()
-
-        if is_on:
-            logger.debug(f"Turning off gauge {name}")
-            self.send_command(f'#0030{address}')
-
-            self.data_mutex.lock()
+        if self.is_on:
+            logger.debug(f"Turning off gauge {self.name}")
+            self.send_command(f'#0030{self.address}')
             self.is_on = False
-            self.data_mutex.unlock()
-
             self.is_on_changed.emit(False)
             self.rate_per_second = None
             self.rate_changed.emit(0)
             return
         
-        self.data_mutex.lock()
         self.is_on = True
-        self.data_mutex.unlock()
-        
-        logger.debug(f"Turning on gauge {name}")
+        logger.debug(f"Turning on gauge {self.name}")
         self.is_on_changed.emit(True)
-        self.send_command(f'#0031{address}')
+        self.send_command(f'#0031{self.address}')
     
     @Slot()
     def start_polling(self, polling_interval_ms: int):
-        self.data_mutex.lock()
         logger.debug(f"Starting polling for gauge {self.name}")
         self.polling_interval_ms = polling_interval_ms
         self.is_polling = True
         QTimer.singleShot(0, self._poll)
-        self.data_mutex.unlock()
     
     @Slot()
     def stop_polling(self, gauge):
-        self.data_mutex.lock()
         logger.debug(f"Stopping polling for gauge {self.name}")
         self.is_polling = False
-        self.data_mutex.unlock()
         
     def _poll(self):
-        self.data_mutex.lock()
-        is_polling = self.is_polling
-        self.data_mutex.unlock()
-        
-        if not is_polling:
+        if not self.is_polling:
             return
         
         # Poll and ensure interval if calls are faster
@@ -193,17 +165,11 @@ class PressureGaugeWorker(QObject):
         QTimer.singleShot(delay, self._poll)
 
     def poll(self):
-        self.data_mutex.lock()
-        address = self.address
-        self.data_mutex.unlock()
-
-        res = self.send_command(f'#0002{address}')
+        res = self.send_command(f'#0002{self.address}')
         if not res:
             return
         
-        self.data_mutex.lock()
         self.new_serial_data.emit(f"I: {res}")
-        self.data_mutex.unlock()
         
         res = res[1:] # trim leading >
         # Scientific notation regex
@@ -213,20 +179,16 @@ class PressureGaugeWorker(QObject):
 
                 # Pressure gauge is off if value is 0.00
                 if value <= 0:
-                    self.data_mutex.lock()
                     if self.is_on:
                         self.is_on = False
                         self.is_on_changed.emit(self.is_on)
-                    self.data_mutex.unlock()
                     return
                 
                 self.pressure_changed.emit(value)
                 
-                self.data_mutex.lock()
                 if not self.is_on:
                     self.is_on = True
                     self.is_on_changed.emit(self.is_on)
-                self.data_mutex.unlock()
                 
                 # Update rate per second
                 if self.rate_per_second:
@@ -241,10 +203,5 @@ class PressureGaugeWorker(QObject):
                 logger.debug(f"Error in converting pressure gauge data to value: {res}")
         
     def send_custom_command(self, command):
-        self.data_mutex.lock()
-        address = self.address
-        name = self.name
-        self.data_mutex.unlock()
-        
-        logger.debug(f"Sending custom gauge command to {address} ({name}): {command}")
-        self.send_command(f'#{command}{address}')
\ No newline at end of file
+        logger.debug(f"Sending custom gauge command to {self.address} ({self.name}): {command}")
+        self.send_command(f'#{command}{self.address}')
\ No newline at end of file
@@ -1,4 +1,4 @@
-from PySide6.QtCore import QMutex, QObject, Signal, QThread, Slot, QTimer
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, Signal, QThread, Slot, QTimer
 import logging
 import serial
 
@@ -74,7 +74,6 @@ class ShutterWorker(QObject):
         self.ser = ser
         self.serial_mutex = serial_mutex
         self.enabled = True
-        self.data_mutex = QMutex()
 
         self.open_close_buffer = []
         self.open_close_timer = QTimer(self)
@@ -84,79 +83,53 @@ class ShutterWorker(QObject):
     @Slot(str) 
     def send_command(self, cmd):
         """Send a message to the serial port."""
-        self.serial_mutex.lock()
-        
-        if self.ser and self.ser.is_open:
-            try:
-                self.ser.write(f"{cmd}\r\n".encode('utf-8'))
+        with QMutexLocker(self.serial_mutex):
+            if self.ser and self.ser.is_open:
+                try:
+                    self.ser.write(f"{cmd}\r\n".encode('utf-8'))
                 
-                self.data_mutex.lock()
-                self.new_serial_data.emit(f"O: {cmd}")
-                self.data_mutex.unlock()
+                    self.new_serial_data.emit(f"O: {cmd}")
                 
-                res = self.ser.readline()
-                if res:
-                    message = res.decode('utf-8', errors='ignore').strip()
-                    self.data_mutex.lock()
-                    self.new_serial_data.emit(f"I: {message}")
-                    self.data_mutex.unlock()
+                    res = self.ser.readline()
+                    if res:
+                        message = res.decode('utf-8', errors='ignore').strip()
+                        self.new_serial_data.emit(f"I: {message}")
                     
-            except Exception as e:
-                self.data_mutex.lock()
-                logger.error(f"Error in sending serial data on port {self.ser.port}: {e}")
-                self.data_mutex.unlock()
-                
-        self.serial_mutex.unlock()
+                except Exception as e:
+                    logger.error(f"Error in sending serial data on port {self.ser.port}: {e}")
 
     @Slot() 
     def enable(self):
-        self.data_mutex.lock()
         self.enabled = True
-        self.data_mutex.unlock()
             
     @Slot()
     def disable(self):
-        self.data_mutex.lock()
         self.enabled = False
-        self.data_mutex.unlock()
 
     def reset(self):
-        self.data_mutex.lock()
-        enabled = self.enabled
-        address = self.address
-        self.data_mutex.unlock()
-        
-        if not enabled:
+        if not self.enabled:
             return
         
         self.in_motion_changed.emit(True)
-        self.send_command(f'/{address}TR')
-        self.send_command(f'/{address}e0R')
+        self.send_command(f'/{self.address}TR')
+        self.send_command(f'/{self.address}e0R')
         self.in_motion_changed.emit(False)
         self.is_open_changed.emit(False)
 
     @Slot()
     def open(self):
-        self.data_mutex.lock()
         self.open_close_buffer.append(True)
-        self.data_mutex.unlock()
 
     @Slot()
     def close(self):
-        self.data_mutex.lock()
         self.open_close_buffer.append(False)
-        self.data_mutex.unlock()
 
     def _execute_open_close(self):
-        self.data_mutex.lock()
-        enabled = self.enabled
-        address = self.address
-        name = self.name
-        self.data_mutex.unlock()
-
-        if not enabled:
+        if not self.enabled:
             return
         
+        address = self.address
+        name = self.name
         if self.open_close_buffer:
             open = self.open_close_buffer.pop(0)
 
@@ -178,17 +151,11 @@ class ShutterWorker(QObject):
         
     @Slot()
     def send_custom_command(self, command):
-        self.data_mutex.lock()
-        enabled = self.enabled
-        address = self.address
-        name = self.name
-        self.data_mutex.unlock()
-        
-        if not enabled:
+        if not self.enabled:
             return
         
-        logger.debug(f"Sending custom shutter command to {address} ({name}): {command}")
-        self.send_command(f'/{address}{command}')
+        logger.debug(f"Sending custom shutter command to {self.address} ({self.name}): {command}")
+        self.send_command(f'/{self.address}{command}')
 
 
 class VirtualShutterWorker(ShutterWorker):
@@ -201,7 +168,6 @@ class VirtualShutterWorker(ShutterWorker):
         self.name = name
         self.address = address
         self.enabled = True
-        self.data_mutex = QMutex()
 
     @Slot(str) 
     def send_command(self, cmd):
@@ -209,44 +175,28 @@ class VirtualShutterWorker(ShutterWorker):
 
     @Slot() 
     def enable(self):
-        self.data_mutex.lock()
         self.enabled = True
-        self.data_mutex.unlock()
             
     @Slot()
     def disable(self):
-        self.data_mutex.lock()
         self.enabled = False
-        self.data_mutex.unlock()
 
     def reset(self):
-        self.data_mutex.lock()
-        enabled = self.enabled
-        self.data_mutex.unlock()
-        
-        if not enabled:
+        if not self.enabled:
             return
         
         self.is_open_changed.emit(self, False)
 
     @Slot()
     def open(self):
-        self.data_mutex.lock()
-        enabled = self.enabled
-        self.data_mutex.unlock()
-        
-        if not enabled:
+        if not self.enabled:
             return
         
         self.is_open_changed.emit(self, True)
 
     @Slot()
     def close(self):
-        self.data_mutex.lock()
-        enabled = self.enabled
-        self.data_mutex.unlock()
-        
-        if not enabled:
+        if not self.enabled:
             return
         
         self.is_open_changed.emit(self, False)
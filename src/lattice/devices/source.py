@@ -1,4 +1,4 @@
-from PySide6.QtCore import Signal, QMutex, QThread, QObject, QTimer, Slot
+from PySide6.QtCore import Signal, QMutex, QMutexLocker, QThread, QObject, QTimer, Slot
 from pymodbus.client.serial import ModbusSerialClient as ModbusClient
 from pymodbus.exceptions import ModbusException
 import logging
@@ -10,6 +10,43 @@ from lattice.definitions import SOURCE_MODBUS_ADDRESSES
 
 logger = logging.getLogger(__name__)
 
+# Polled values, each a FLOAT32 spanning two registers. Setpoint and rate
+# limit only change when written, so they are read every SLOW_POLL_TICKS polls
+FAST_POLL_KEYS = ("process_variable", "working_setpoint")
+SLOW_POLL_KEYS = ("setpoint", "setpoint_rate_limit")
+SLOW_POLL_TICKS = 5
+
+PID_KEYS = ("pid_pb", "pid_ti", "pid_td")
+
+# Largest span of registers read in one request when batching PID values
+MAX_BLOCK_REGISTERS = 32
+
+def group_registers(addresses: dict[str, int], keys, max_count=MAX_BLOCK_REGISTERS):
+    """
+    Groups FLOAT32 values at contiguous addresses into single holding register reads
+    Returns a list of (start, count, [(key, offset), ...])
+    
+    Gaps are never bridged, a controller may reject the registers in
+    between as illegal addresses and fail the whole read
+    """
+    blocks = []
+    for key in sorted(keys, key=addresses.__getitem__):
+        address = addresses[key]
+        if blocks and address == blocks[-1][0] + blocks[-1][1] and address + 2 - blocks[-1][0] <= max_count:
+            start, _, fields = blocks[-1]
+            fields.append((key, address - start))
+            blocks[-1] = (start, address + 2 - start, fields)
+        else:
+            blocks.append((address, 2, [(key, 0)]))
+    return blocks
+
+# Block layouts only depend on the address set, so build them once at import.
+# Poll values are not contiguous in any address set and are read one by one
+PID_BLOCKS = {
+    name: group_registers(addresses, PID_KEYS)
+    for name, addresses in SOURCE_MODBUS_ADDRESSES.items()
+}
+
 class Source(QObject):
     """
     safety_settings = (rate_limit, from, to)
@@ -36,7 +73,7 @@ class Source(QObject):
     new_modbus_data = Signal(str) # Message
     is_pv_close_to_sp_changed = Signal(bool)
     is_stable_changed = Signal(bool)
-    safety_settings_changed = safety_settings_changed = Signal(float, float, float, float, float) # rate limit, from, to, max setpoint, stability tolerance
+    safety_settings_changed = Signal(float, float, float, float, float) # rate limit, from, to, max setpoint, stability tolerance
 
     def __init__(self, 
                  name, 
@@ -273,8 +310,16 @@ class SourceWorker(QObject):
         self.name = name
         self.device_id = device_id
         self.addresses = SOURCE_MODBUS_ADDRESSES[address_set]
+        self.pid_blocks = PID_BLOCKS[address_set]
         self.client = client
         self.serial_mutex = serial_mutex
+
+        # Client methods used on every request, bound once
+        self._read_registers = client.read_holding_registers
+        self._write_registers = client.write_registers
+        self._decode = client.convert_from_registers
+        self._encode = client.convert_to_registers
+        self._float32 = client.DATATYPE.FLOAT32
         self.desired_rate_limit = 0.1
         self.is_pv_close_to_sp = False
         self.is_stable = False
@@ -300,61 +345,117 @@ class SourceWorker(QObject):
 
         # Create and connect poll timer
         self._polling = False
+        self._poll_tick = 0
+        self.setpoint = None # Last read setpoint
+        self.rate_limit = None # Last read rate limit
         self.poll_timer = QTimer(self)
         self.poll_timer.timeout.connect(self._poll)
 
-        # Create and connect the stability timer
+        # Stability is checked from _poll, at most once per second
         self.stability_time = time.monotonic()
-        self.stability_check_timer = QTimer(self)
-        self.stability_check_timer.timeout.connect(self._check_stability)
-        self.stability_check_timer.start(1000)
+        self.last_stability_check = 0.0
 
     @Slot(int, int)
     def read_data_by_address(self, address: int, count=2):
-        self.serial_mutex.lock()
-        try:
-            res = self.client.read_holding_registers(address=address, count=count, device_id=self.device_id)
+        with QMutexLocker(self.serial_mutex):
+            try:
+                res = self._read_registers(address=address, count=count, device_id=self.device_id)
 
-            if res.isError():
-                logger.warning(f"Modbus response was error when reading address {address} from source {self.device_id}, {self.name}: {res}")
-                return None
+                if res.isError():
+                    logger.warning(f"Modbus response was error when reading address {address} from source {self.device_id}, {self.name}: {res}")
+                    return None
             
-            value = self.client.convert_from_registers(res.registers, self.client.DATATYPE.FLOAT32)
-            self.new_modbus_data.emit(f"Read: {address} | Result: {value}")
+                value = self._decode(res.registers, self._float32)
+                self.new_modbus_data.emit(f"Read: {address} | Result: {value}")
 
-            return value
-        
-        except Exception as e:
-            logger.error(f"Error reading address {address} from source {self.device_id}, {self.name}: {e}")
-            return None
+                return value
         
-        finally:
-            self.serial_mutex.unlock()
+            except Exception as e:
+                logger.error(f"Error reading address {address} from source {self.device_id}, {self.name}: {e}")
+                return None
 
     @Slot(int, float)
     def write_data_by_address(self, address: int, value: float):
-        self.serial_mutex.lock()
-        try:
-            encoded_value = self.client.convert_to_registers(value, self.client.DATATYPE.FLOAT32)
-            res = self.client.write_registers(address=address, values=encoded_value, device_id=self.device_id)
-            if res.isError():
-                logger.warning(f"Modbus response was error when writing address {address} to source id {self.device_id}, {self.name}: {res}")
+        with QMutexLocker(self.serial_mutex):
+            try:
+                encoded_value = self._encode(value, self._float32)
+                res = self._write_registers(address=address, values=encoded_value, device_id=self.device_id)
+                if res.isError():
+                    logger.warning(f"Modbus response was error when writing address {address} to source id {self.device_id}, {self.name}: {res}")
                 
-            self.new_modbus_data.emit(f"Write: {address} | Value: {value}")
+                self.new_modbus_data.emit(f"Write: {address} | Value: {value}")
         
-        except ModbusException as e:
-            logger.error(f"Error writing address {address} to source id {self.device_id}, {self.name}: {e}")
-        
-        finally:
-            self.serial_mutex.unlock()
+            except ModbusException as e:
+                logger.error(f"Error writing address {address} to source id {self.device_id}, {self.name}: {e}")
+
+    def _read_block(self, start: int, count: int) -> list[int] | None:
+        with QMutexLocker(self.serial_mutex):
+            try:
+                res = self._read_registers(address=start, count=count, device_id=self.device_id)
+
+                if res.isError():
+                    logger.warning(f"Modbus response was error when reading {count} registers at {start} from source {self.device_id}, {self.name}: {res}")
+                    return None
+
+                return res.registers
+
+            except Exception as e:
+                logger.error(f"Error reading {count} registers at {start} from source {self.device_id}, {self.name}: {e}")
+                return None
+
+    def _read_blocks(self, blocks) -> dict[str, float]:
+        """
+        Reads each block in one request and decodes its values by key,
+        values from blocks that failed to read are left out
+        """
+        values = {}
+        for start, count, fields in blocks:
+            registers = self._read_block(start, count)
+            if registers is None:
+                continue
+
+            for key, offset in fields:
+                value = self._decode(registers[offset:offset + 2], self._float32)
+                values[key] = value
+                self.new_modbus_data.emit(f"Read: {start + offset} | Result: {value}")
+
+        return values
+
+    def _write_values(self, values: dict[str, float]):
+        """
+        Writes FLOAT32 values by key, using one request for each run of
+        contiguous registers so gaps in the address map are never written
+        """
+        runs = [] # (start, registers, [(address, value), ...])
+        for key in sorted(values, key=self.addresses.__getitem__):
+            address, value = self.addresses[key], values[key]
+            encoded = self._encode(value, self._float32)
+            if runs and runs[-1][0] + len(runs[-1][1]) == address:
+                runs[-1][1].extend(encoded)
+                runs[-1][2].append((address, value))
+            else:
+                runs.append((address, list(encoded), [(address, value)]))
+
+        # One hold for all runs so related values (e.g. PID terms) are never
+        # interleaved with another device's traffic on the shared bus
+        with QMutexLocker(self.serial_mutex):
+            for start, registers, written in runs:
+                try:
+                    res = self._write_registers(address=start, values=registers, device_id=self.device_id)
+                    if res.isError():
+                        logger.warning(f"Modbus response was error when writing {len(registers)} registers at {start} to source id {self.device_id}, {self.name}: {res}")
+
+                    for address, value in written:
+                        self.new_modbus_data.emit(f"Write: {address} | Value: {value}")
+
+                except ModbusException as e:
+                    logger.error(f"Error writing {len(registers)} registers at {start} to source id {self.device_id}, {self.name}: {e}")
 
     def _read_data_by_key(self, key: str, count=2):
-        address = self.addresses[key]
-        return self.read_data_by_address(address, count)
+        return self.read_data_by_address(self.addresses[key], count)
 
     def _write_data_by_key(self, key: str, value: float):
-        address = self.addresses[key]
-        return self.write_data_by_address(address, value)
+        return self.write_data_by_address(self.addresses[key], value)
     
     @Slot(int)
     def start_polling(self, interval_ms: int):
@@ -375,55 +476,63 @@ class SourceWorker(QObject):
         self._polling = True
         
         try:
-            new_process_variable = self._read_process_variable()
-            new_setpoint = self._read_setpoint()
-            new_working_setpoint = self._read_working_setpoint()
-            new_rate_limit = self._read_rate_limit()
+            keys = FAST_POLL_KEYS
+            if self._poll_tick % SLOW_POLL_TICKS == 0:
+                keys += SLOW_POLL_KEYS
+            values = {key: self._read_data_by_key(key) for key in keys}
+            self._poll_tick += 1
+
+            new_process_variable = values.get("process_variable")
+            new_setpoint = values.get("setpoint")
+            new_working_setpoint = values.get("working_setpoint")
+            new_rate_limit = values.get("setpoint_rate_limit")
 
             if new_setpoint is not None:
+                self.setpoint = new_setpoint
                 self.setpoint_changed.emit(new_setpoint)
 
             if new_rate_limit is not None:
+                self.rate_limit = new_rate_limit
                 self.rate_limit_changed.emit(new_rate_limit)
 
             if new_process_variable is not None:
                 self.process_variable_changed.emit(new_process_variable)
 
-                if new_setpoint is not None:
-                    self.is_pv_close_to_sp = math.isclose(new_setpoint, new_process_variable, abs_tol=self.stability_tolerance)
+                if self.setpoint is not None:
+                    self.is_pv_close_to_sp = abs(self.setpoint - new_process_variable) <= self.stability_tolerance
                     self.is_pv_close_to_sp_changed.emit(self.is_pv_close_to_sp)
 
             if new_working_setpoint is not None:
                 self.working_setpoint_changed.emit(new_working_setpoint)
 
                 # Check if setpoint is within safety range and apply safe rate limit,
-                # skip if current rate limit was not read
-                if new_rate_limit is not None:
+                # skip if current rate limit has not been read yet
+                if self.rate_limit is not None:
                     safe_rate, safe_from, safe_to = self.safe_rate_limit, self.safe_rate_limit_from, self.safe_rate_limit_to
                     if (safe_rate > 0 and safe_from < new_working_setpoint < safe_to):
                         target = safe_rate
                     else:
                         target = self.desired_rate_limit
                     
-                    if new_rate_limit != target:
+                    # The device stores FLOAT32, so an exact comparison against
+                    # the target would never match and rewrite it every poll
+                    if not math.isclose(self.rate_limit, target, rel_tol=1e-6):
                         self._write_rate_limit(target)
+                        self.rate_limit = target
+                        # Read the new rate limit back on the next poll
+                        self._poll_tick = 0
+
+            # Stability only changes with new readings, so check it here
+            # rather than waking up on a separate timer
+            now = time.monotonic()
+            if now - self.last_stability_check >= 1:
+                self.last_stability_check = now
+                self._check_stability()
 
         # Ensure polling guard gets reset no matter what
         finally:
             self._polling = False
 
-    def _read_process_variable(self) -> float | None:
-        return self._read_data_by_key("process_variable", count=2)
-    
-    def _read_setpoint(self) -> float:
-        return self._read_data_by_key("setpoint", count=2)
-
-    def _read_working_setpoint(self) -> float:
-        return self._read_data_by_key("working_setpoint", count=2)
-    
-    def _read_rate_limit(self) -> float:
-        return self._read_data_by_key("setpoint_rate_limit", count=2)
-    
     def _write_rate_limit(self, rate_limit):
         self._write_data_by_key("setpoint_rate_limit", rate_limit)
     
@@ -432,9 +541,10 @@ class SourceWorker(QObject):
         """
         Returns pid_pb, pid_ti, and pid_td as tuple
         """
-        pid_pb = self._read_data_by_key("pid_pb", count=2)
-        pid_ti = self._read_data_by_key("pid_ti", count=2)
-        pid_td = self._read_data_by_key("pid_td", count=2)
+        values = self._read_blocks(self.pid_blocks)
+        pid_pb = values.get("pid_pb")
+        pid_ti = values.get("pid_ti")
+        pid_td = values.get("pid_td")
         
         # If any failed to read
         if None in (pid_pb, pid_ti, pid_td):
@@ -451,9 +561,7 @@ class SourceWorker(QObject):
             - pid_ti: {pid_ti}
             - pid_td: {pid_td}
             """)
-        self._write_data_by_key("pid_pb", pid_pb)
-        self._write_data_by_key("pid_ti", pid_ti)
-        self._write_data_by_key("pid_td", pid_td)
+        self._write_values({"pid_pb": pid_pb, "pid_ti": pid_ti, "pid_td": pid_td})
 
     @Slot(float, float, float)
     def set_rate_limit_safety(self, rate_limit: float, rate_limit_from: float, rate_limit_to: float):
@@ -496,6 +604,8 @@ class SourceWorker(QObject):
             return
         
         self._write_data_by_key('setpoint', setpoint)
+        # Read the new setpoint back on the next poll
+        self._poll_tick = 0
 
     @Slot(float)
     def set_desired_rate_limit(self, rate_limit: float):
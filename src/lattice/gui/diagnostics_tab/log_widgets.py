@@ -89,7 +89,8 @@ class SerialLogWidget(QWidget):
     def append_data(self, key, data):
         self.data[key].append(data)
         
-        if key == self.selection.currentText():
+        # Only redraw the log while it is on screen, showEvent catches up
+        if key == self.selection.currentText() and self.log.isVisible():
             # Store current scrollbar position
             current_scroll_pos = self.log.verticalScrollBar().value()
             autoscroll = current_scroll_pos == self.log.verticalScrollBar().maximum()
@@ -106,6 +107,10 @@ class SerialLogWidget(QWidget):
             
             self.log.verticalScrollBar().setValue(current_scroll_pos)
             
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.change_log()
+        
     def change_log(self):
         key = self.selection.currentText()
         self.log.setPlainText('\n'.join(self.data[key]))
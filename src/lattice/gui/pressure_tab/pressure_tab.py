@@ -14,17 +14,17 @@ from PySide6.QtCore import (
     Qt,
     Signal,
     Slot,
-    QMutex
+    QMutex,
+    QTimer
 )
 from PySide6.QtGui import QColor
-from collections import deque
 import sys
 import logging
 
 # Local imports
 from lattice.devices import PressureGauge, MockPressureGauge
 from lattice.gui.widgets import StackedScrollingPlotWidget
-from lattice.utils import timing
+from lattice.utils import timing, RingBuffer
 from .pressure_control_widget import PressureControlWidget
 
 logger = logging.getLogger(__name__)
@@ -41,11 +41,10 @@ class PressureTab(QWidget):
         # SETUP #
         #########
         
-        # Initialize pressure data object and connect signal
+        # Initialize pressure data object
         self.pressure_data = {}
         for gauge in self.pressure_gauges:
-            self.pressure_data[gauge] = deque(maxlen=7200) # 3 hours of data at polling rate of 500ms
-            gauge.pressure_changed.connect(lambda data, g=gauge: self.on_new_pressure_data(data, g))
+            self.pressure_data[gauge] = RingBuffer(maxlen=7200) # 3 hours of data at polling rate of 500ms
             
         #####################
         # CONFIGURE WIDGETS #
@@ -53,6 +52,7 @@ class PressureTab(QWidget):
         
         # Create and connect pressure control widgets
         self.control_widgets: list[PressureControlWidget] = []
+        self.control_widgets_by_gauge: dict[PressureGauge, PressureControlWidget] = {}
         hue_step_size = int(360 / len(self.pressure_gauges))
         
         for i, gauge in enumerate(self.pressure_gauges):
@@ -66,9 +66,10 @@ class PressureTab(QWidget):
             # Create control widget
             controls = PressureControlWidget(gauge.name, color)
             self.control_widgets.append(controls)
+            self.control_widgets_by_gauge[gauge] = controls
             
-            # Connect displayed pressure
-            gauge.pressure_changed.connect(controls.format_and_display_pressure)
+            # Connect displayed pressure and stored data through a single slot
+            gauge.pressure_changed.connect(self.on_new_pressure_data)
             
             # Connect rate display
             gauge.rate_changed.connect(controls.format_and_display_rate)
@@ -100,6 +101,12 @@ class PressureTab(QWidget):
         self.time_lock_input.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
         self.time_lock_input.setAlignment(Qt.AlignmentFlag.AlignRight)
         
+        # Gauges report one at a time, so coalesce their samples into one replot
+        self.replot_timer = QTimer(self)
+        self.replot_timer.setSingleShot(True)
+        self.replot_timer.setInterval(50)
+        self.replot_timer.timeout.connect(self.update_plot)
+        
         ##################
         # LAYOUT WIDGETS #
         ##################
@@ -143,11 +150,20 @@ class PressureTab(QWidget):
         for gauge in self.pressure_gauges:
             gauge.start_polling(1000)
 
-    @Slot(PressureGauge, float) # Gauge ref, Value
-    def on_new_pressure_data(self, data, gauge: PressureGauge):
-        # Store data
-        self.pressure_data[gauge].append((timing.uptime_seconds(), data))
+    @Slot(float)
+    def on_new_pressure_data(self, data):
+        gauge: PressureGauge = self.sender()
+        
+        # Display and store data
+        self.control_widgets_by_gauge[gauge].format_and_display_pressure(data)
+        self.pressure_data[gauge].append(timing.uptime_seconds(), data)
         
+        # Replot once the pending samples have arrived
+        if not self.replot_timer.isActive():
+            self.replot_timer.start()
+
+    @Slot()
+    def update_plot(self):
         # Update plot and constrain x-axis
         if self.time_lock_checkbox.isChecked():
             time_delta = self.time_lock_input.value()
@@ -17,8 +17,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QApplication, QHBoxLayout, QHeaderView, QLabel,
     QLayout, QLineEdit, QPushButton, QSizePolicy,
-    QSpacerItem, QTableWidget, QTableWidgetItem, QToolButton,
-    QVBoxLayout, QWidget)
+    QSpacerItem, QTableWidget, QToolButton, QVBoxLayout,
+    QWidget)
 
 class Ui_RecipeTab(object):
     def setupUi(self, RecipeTab):
@@ -61,30 +61,6 @@ class Ui_RecipeTab(object):
         self.verticalLayout.addLayout(self.horizontalLayout_6)
 
         self.recipe_table = QTableWidget(RecipeTab)
-        if (self.recipe_table.columnCount() < 11):
-            self.recipe_table.setColumnCount(11)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(6, __qtablewidgetitem6)
-        __qtablewidgetitem7 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(7, __qtablewidgetitem7)
-        __qtablewidgetitem8 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(8, __qtablewidgetitem8)
-        __qtablewidgetitem9 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(9, __qtablewidgetitem9)
-        __qtablewidgetitem10 = QTableWidgetItem()
-        self.recipe_table.setHorizontalHeaderItem(10, __qtablewidgetitem10)
         if (self.recipe_table.rowCount() < 1):
             self.recipe_table.setRowCount(1)
         self.recipe_table.setObjectName(u"recipe_table")
@@ -218,28 +194,6 @@ class Ui_RecipeTab(object):
         self.recipe_save.setText("")
         self.recipe_load.setText("")
         self.add_recipe_step.setText(QCoreApplication.translate("RecipeTab", u"Add Step", None))
-        ___qtablewidgetitem = self.recipe_table.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("RecipeTab", u"Action", None));
-        ___qtablewidgetitem1 = self.recipe_table.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("RecipeTab", u"1", None));
-        ___qtablewidgetitem2 = self.recipe_table.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("RecipeTab", u"2", None));
-        ___qtablewidgetitem3 = self.recipe_table.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("RecipeTab", u"3", None));
-        ___qtablewidgetitem4 = self.recipe_table.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("RecipeTab", u"4", None));
-        ___qtablewidgetitem5 = self.recipe_table.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("RecipeTab", u"5", None));
-        ___qtablewidgetitem6 = self.recipe_table.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("RecipeTab", u"6", None));
-        ___qtablewidgetitem7 = self.recipe_table.horizontalHeaderItem(7)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("RecipeTab", u"7", None));
-        ___qtablewidgetitem8 = self.recipe_table.horizontalHeaderItem(8)
-        ___qtablewidgetitem8.setText(QCoreApplication.translate("RecipeTab", u"8", None));
-        ___qtablewidgetitem9 = self.recipe_table.horizontalHeaderItem(9)
-        ___qtablewidgetitem9.setText(QCoreApplication.translate("RecipeTab", u"9", None));
-        ___qtablewidgetitem10 = self.recipe_table.horizontalHeaderItem(10)
-        ___qtablewidgetitem10.setText(QCoreApplication.translate("RecipeTab", u"10", None));
         self.recipe_time_monitor_label_2.setText(QCoreApplication.translate("RecipeTab", u"Time Remaining", None))
         self.recipe_loop_monitor_label_2.setText(QCoreApplication.translate("RecipeTab", u"     Current Iteration", None))
         self.recipe_start.setText(QCoreApplication.translate("RecipeTab", u"Start Recipe", None))
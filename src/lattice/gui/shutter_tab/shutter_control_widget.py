@@ -31,6 +31,12 @@ NAME_DISPLAY_STYLE = """
     color: rgb(0, 0, 0);
 """
 
+def refresh_button_style(button: QPushButton):
+    # Re-evaluate the [is_on]/[is_open] selectors after a property change,
+    # polish alone drops the cached rules so no unpolish is needed
+    button.style().polish(button)
+    button.update()
+
 class ShutterControlWidget(QWidget):
     def __init__(self, name: str, num_steps: int, parent=None):
         super().__init__(parent)
@@ -70,11 +76,8 @@ class ShutterControlWidget(QWidget):
         for button in self.step_state_buttons:
             button.setProperty('is_open', False)
             
-        # Apply button stylesheets
-        self.output_button.setStyleSheet(BUTTON_STYLE)
-        self.control_button.setStyleSheet(BUTTON_STYLE)
-        for button in self.step_state_buttons:
-            button.setStyleSheet(BUTTON_STYLE)
+        # Apply button stylesheet once, the buttons inherit it from this widget
+        self.setStyleSheet(BUTTON_STYLE)
         
         # Create step_button_layout
         step_button_layout = QHBoxLayout()
@@ -1,11 +1,11 @@
 from PySide6.QtWidgets import QWidget, QPushButton
-from PySide6.QtCore import QThread, QTimer, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, Slot
 import logging
 import time
 
 # Local imports
 from lattice.devices.shutter import Shutter
-from .shutter_control_widget import ShutterControlWidget
+from .shutter_control_widget import ShutterControlWidget, refresh_button_style
 from .ui_shutter_tab import Ui_ShutterTab
 
 logger = logging.getLogger(__name__)
@@ -21,19 +21,32 @@ class ShutterTab(QWidget, Ui_ShutterTab):
         # SETUP #
         #########
 
-        for i, shutter in enumerate(self.shutters):
-            shutter.is_open_changed.connect(lambda is_open, idx=i: self.on_state_change(is_open, idx))
+        self.shutter_indices = {shutter: i for i, shutter in enumerate(self.shutters)}
+        for shutter in self.shutters:
+            shutter.is_open_changed.connect(self.on_state_change)
         
         self.current_step = 0
         self.loop_step_timer = QTimer()
         self.loop_step_timer.setSingleShot(True)
+        self.loop_step_timer.setTimerType(Qt.PreciseTimer) # Coarse can be off by 5% of the step
+        self.step_deadline = 0.0 # Monotonic time the current step should end at
         self.loop_step_timer.timeout.connect(self._trigger_next_step)
         
         # The two QElapsed timers remain accurate even if the program or system lags
         self.loop_time_elapsed_ms = 0
         self.step_time_elapsed_ms = 0
         self.loop_stopwatch_update_timer = QTimer()
+        self.loop_stopwatch_update_timer.setTimerType(Qt.CoarseTimer) # Display only
         self.loop_stopwatch_update_timer.timeout.connect(self.update_loop_timers)
+        
+        # Look up loop displays and inputs once, they are touched every step/tick
+        num_steps = 6 # Number of steps is not currently variable on UI side
+        self.step_display = self.shutter_current_step
+        self.loop_count_display = self.shutter_loop_count
+        self.max_step_input = self.max_loop_step
+        self.step_time_inputs = [getattr(self, f"step_time_{i + 1}") for i in range(num_steps)]
+        self.loop_timer_display = self.shutter_loop_time_elapsed
+        self.step_timer_display = self.shutter_loop_time_in_step
 
         ###################
         # CONTROLS CONFIG #
@@ -43,9 +56,17 @@ class ShutterTab(QWidget, Ui_ShutterTab):
         controls_layout = getattr(self, "shutter_controls_layout", None)
         self.control_widgets: list[ShutterControlWidget] = []
         for shutter in self.shutters:
-            widget = ShutterControlWidget(shutter.name, num_steps=6) # Number of steps is not currently variable on UI side
+            widget = ShutterControlWidget(shutter.name, num_steps=num_steps)
             self.control_widgets.append(widget)
             controls_layout.addWidget(widget)
+        
+        # Open/closed state of each step per shutter, kept in sync with the
+        # step state buttons so loop steps don't query Qt properties
+        self.step_states = [[False] * num_steps for _ in self.shutters]
+        
+        # Last open/close sent to each shutter by the loop, None when unknown
+        # (loop start, manual output or enable changes) so the next step resends it
+        self.commanded_open: list[bool | None] = [None] * len(self.shutters)
             
         # Connect shutter controls displays and buttons
         for i, controls in enumerate(self.control_widgets):
@@ -58,16 +79,17 @@ class ShutterTab(QWidget, Ui_ShutterTab):
             controls.output_button.setProperty('idx', i)
             
             # Connect state buttons and set property
-            for button in controls.step_state_buttons:
+            for step, button in enumerate(controls.step_state_buttons):
                 button.clicked.connect(self.on_step_state_button_clicked)
                 button.setProperty('idx', i)
+                button.setProperty('step', step)
             
         # Connect shutter disable all button
-        control_off_all_button = getattr(self, "shutter_control_off_all")
+        control_off_all_button = self.shutter_control_off_all
         control_off_all_button.clicked.connect(self.on_control_off_all_click)
                 
         # Connect start/stop button to logic
-        loop_toggle_button = getattr(self, "shutter_loop_toggle")
+        loop_toggle_button = self.shutter_loop_toggle
         loop_toggle_button.clicked.connect(self.on_toggle_loop_button_click)
 
         # Connect state time inputs
@@ -77,15 +99,15 @@ class ShutterTab(QWidget, Ui_ShutterTab):
             if widget:
                 widget.valueChanged.connect()
 
+    @Slot()
     def on_toggle_loop_button_click(self):
         button = self.sender()
         self.current_step = 0
+        self.commanded_open = [None] * len(self.shutters)
         
-        step_display = getattr(self, "shutter_current_step", None)
-        step_display.setText("0")
-        loop_count_display = getattr(self, "shutter_loop_count", None)
-        loop_count_display.setProperty("loop_count", 0)
-        loop_count_display.setText("0")
+        self.step_display.setText("0")
+        self.loop_count_display.setProperty("loop_count", 0)
+        self.loop_count_display.setText("0")
         
         # If loop is already running
         if self.loop_step_timer.isActive():
@@ -116,22 +138,23 @@ class ShutterTab(QWidget, Ui_ShutterTab):
             background-color: rgb(255, 0, 0);
             """)
         self.loop_start_time = time.monotonic()
+        self.step_deadline = self.loop_start_time
         self.loop_stopwatch_update_timer.start(100)
         self._trigger_next_step()
         
+    @Slot()
     def _trigger_next_step(self):
         step = self.current_step
         
         # Increment loop count
         if step == 0:
-            loop_count_display = getattr(self, "shutter_loop_count", None)
+            loop_count_display = self.loop_count_display
             count = loop_count_display.property("loop_count")
             loop_count_display.setProperty("loop_count", count + 1)
             loop_count_display.setText(f"{count + 1}")
         
         # Display current step
-        step_display = getattr(self, "shutter_current_step", None)
-        step_display.setText(f"{step + 1}") # Match user-facing number, not index
+        self.step_display.setText(f"{step + 1}") # Match user-facing number, not index
         
         # Store step start time
         self.step_start_time = time.monotonic()
@@ -139,48 +162,50 @@ class ShutterTab(QWidget, Ui_ShutterTab):
         logger.debug(f"Triggering shutter loop step {step + 1}")
         
         
-        for i, controls in enumerate(self.control_widgets):
-            is_open = controls.step_state_buttons[step].property("is_open")
+        # Only command shutters whose state changes on this step
+        for i, (shutter, step_states) in enumerate(zip(self.shutters, self.step_states)):
+            is_open = step_states[step]
+            if self.commanded_open[i] == is_open:
+                continue
+            self.commanded_open[i] = is_open
             if is_open:
-                self.shutters[i].open()
+                shutter.open()
             else:
-                self.shutters[i].close()
+                shutter.close()
         
         # Display elapsed time for state
-        time_input_widget = getattr(self, f"step_time_{step + 1}", None)
-        state_time = int(time_input_widget.value() * 1000) # Sec to ms
+        state_time = int(self.step_time_inputs[step].value() * 1000) # Sec to ms
         logger.debug(f"State time is {state_time}")
         
         # Increment step and check if max step has been reached
-        max_step_input_widget = getattr(self, "max_loop_step", None)
-        max_step = max_step_input_widget.value() - 1 # Indexing starts at 0, user-facing count starts at 1
+        max_step = self.max_step_input.value() - 1 # Indexing starts at 0, user-facing count starts at 1
         if self.current_step < max_step:
             self.current_step += 1
         else:
             self.current_step = 0
         
-        # Start timer to trigger next step
+        # Start timer to trigger next step, scheduled from where this step
+        # should have started so timer latency does not add up over loops
+        self.step_deadline += state_time / 1000
+        delay = max(0, int((self.step_deadline - time.monotonic()) * 1000))
         if self.loop_step_timer.isActive():
             self.loop_step_timer.stop()
-        self.loop_step_timer.start(state_time)
+        self.loop_step_timer.start(delay)
         
+    @Slot()
     def update_loop_timers(self):
-        loop_seconds = time.monotonic() - self.loop_start_time
-        step_seconds = time.monotonic() - self.step_start_time
-        
-        loop_timer = getattr(self, "shutter_loop_time_elapsed", None)
-        step_timer = getattr(self, "shutter_loop_time_in_step", None)
+        now = time.monotonic()
+        loop_seconds = now - self.loop_start_time
+        step_seconds = now - self.step_start_time
         
-        loop_timer.setText(f"{loop_seconds:04.1f} s")
-        step_timer.setText(f"{step_seconds:04.1f} s")
+        self.loop_timer_display.setText(f"{loop_seconds:04.1f} s")
+        self.step_timer_display.setText(f"{step_seconds:04.1f} s")
         
     def reset_loop_timers(self):
-        loop_timer = getattr(self, "shutter_loop_time_elapsed", None)
-        step_timer = getattr(self, "shutter_loop_time_in_step", None)
-        
-        loop_timer.setText(f"{0:04.1f} s")
-        step_timer.setText(f"{0:04.1f} s")
+        self.loop_timer_display.setText(f"{0:04.1f} s")
+        self.step_timer_display.setText(f"{0:04.1f} s")
         
+    @Slot()
     def on_step_state_button_clicked(self):
         button = self.sender()
         is_open = button.property('is_open')
@@ -191,16 +216,17 @@ class ShutterTab(QWidget, Ui_ShutterTab):
         else:
             button.setText("Open")
             button.setProperty("is_open", True)
+        self.step_states[button.property('idx')][button.property('step')] = not is_open
         
         # Refresh button style
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
+        refresh_button_style(button)
             
+    @Slot()
     def on_control_button_click(self):
         button: QPushButton = self.sender()
         is_on = button.property("is_on")
         idx = button.property("idx")
+        self.commanded_open[idx] = None
             
         if is_on:
             button.setText("OFF")
@@ -212,45 +238,48 @@ class ShutterTab(QWidget, Ui_ShutterTab):
             self.shutters[idx].enable()
         
         # Refresh button style
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
+        refresh_button_style(button)
     
+    @Slot()
     def on_control_off_all_click(self):
         for shutter in self.shutters:
             shutter.disable()
+        self.commanded_open = [None] * len(self.shutters)
             
         for controls in self.control_widgets:
             button = controls.control_button
+            if not button.property('is_on'):
+                continue
             button.setProperty('is_on', False)
             button.setText("OFF")
             
             # Refresh button style
-            button.style().unpolish(button)
-            button.style().polish(button)
-            button.update()
+            refresh_button_style(button)
             
+    @Slot()
     def on_output_button_click(self):
         button: QPushButton = self.sender()
         is_open: bool = button.property("is_open")
         idx: int = button.property("idx")
+        self.commanded_open[idx] = None
 
         if is_open:
             self.shutters[idx].close()
         else:
             self.shutters[idx].open()
 
-        # Refresh button style
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
+        # Button style is refreshed by on_state_change once the shutter reports back
         
-    def on_state_change(self, is_open, idx):   
+    @Slot(bool)
+    def on_state_change(self, is_open):
+        idx = self.shutter_indices[self.sender()]
+        # Reports lag commands, so only forget the commanded state when they
+        # disagree, the next step then re-commands the shutter either way
+        if is_open != self.commanded_open[idx]:
+            self.commanded_open[idx] = None
         button = self.control_widgets[idx].output_button
         button.setText("Open" if is_open else "Closed")
         button.setProperty('is_open', is_open)
     
         # Refresh button style
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
\ No newline at end of file
+        refresh_button_style(button)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import sys
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtWidgets import (
     QWidget, 
     QLabel, 
@@ -12,31 +12,41 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QCheckBox
 )
-from PySide6.QtGui import QColor, QPainter, QBrush, QFont
+from PySide6.QtGui import QColor, QPainter, QBrush, QFont, QPen
 
 class ColorCircle(QLabel):
     color_changed = Signal(str)
     
     def __init__(self, color: str, parent=None):
         super().__init__(parent)
-        self.setFixedSize(24, 24)
         self.color = color
         self.setCursor(Qt.PointingHandCursor)
 
+        # Paint objects are built once and reused on every repaint
+        self._pen = QPen(Qt.black)
+        self._brush = QBrush(QColor(color))
+        self._diameter = 0
+        self.setFixedSize(24, 24)
+
     def mousePressEvent(self, event):
         new_color = QColorDialog.getColor(self.color, self, "Select Color")
         if new_color.isValid():
             self.color = new_color
+            self._brush = QBrush(new_color)
             self.color_changed.emit(new_color.name())
             self.update()
 
+    def resizeEvent(self, event):
+        # Only recalculate circle size when the geometry actually changes
+        self._diameter = min(self.width(), self.height()) - 2
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QBrush(self.color))
-        painter.setPen(Qt.black)
-        diameter = min(self.width(), self.height()) - 2
-        painter.drawEllipse(1, 1, diameter, diameter)
+        painter.setBrush(self._brush)
+        painter.setPen(self._pen)
+        painter.drawEllipse(1, 1, self._diameter, self._diameter)
 
 
 class SourceControlWidget(QWidget):
@@ -145,17 +155,42 @@ class SourceControlWidget(QWidget):
 
         self.setLayout(layout)
 
+        # Values from one poll arrive as separate signals, hold them briefly
+        # and update the displays together
+        self.pending_displays: dict[QLineEdit, tuple[float, str]] = {} # Display: (value, unit)
+        self.displayed_values: dict[QLineEdit, float] = {}
+        self.display_timer = QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.setInterval(30)
+        self.display_timer.timeout.connect(self._apply_pending_displays)
+
+    def _queue_display(self, display: QLineEdit, value: float, unit: str):
+        # Most polls repeat the value already shown
+        if display not in self.pending_displays and self.displayed_values.get(display) == value:
+            return
+
+        self.pending_displays[display] = (value, unit)
+        if not self.display_timer.isActive():
+            self.display_timer.start()
+
+    def _apply_pending_displays(self):
+        for display, (value, unit) in self.pending_displays.items():
+            if self.displayed_values.get(display) != value:
+                display.setText(f"{value:.2f} {unit}")
+                self.displayed_values[display] = value
+        self.pending_displays.clear()
+
     def update_process_variable(self, process_variable):
-        self.display_temp.setText(f"{process_variable:.2f} C")
+        self._queue_display(self.display_temp, process_variable, "C")
 
     def update_setpoint(self, setpoint):
-        self.display_setpoint.setText(f"{setpoint:.2f} C")
+        self._queue_display(self.display_setpoint, setpoint, "C")
 
     def update_working_setpoint(self, working_setpoint):
-        self.display_working_setpoint.setText(f"{working_setpoint:.2f} C")
+        self._queue_display(self.display_working_setpoint, working_setpoint, "C")
 
     def update_rate_limit(self, rate_limit):
-        self.display_rate_limit.setText(f"{rate_limit:.2f} C/s")
+        self._queue_display(self.display_rate_limit, rate_limit, "C/s")
 
 # Run as standalone app for testing
 if __name__ == "__main__":
@@ -9,20 +9,18 @@ from PySide6.QtWidgets import (
     QSpacerItem,
     QSizePolicy
     )
-from PySide6.QtCore import QThread, QTimer, Qt, Signal
+from PySide6.QtCore import QThread, QTimer, Qt, Signal, Slot
 from PySide6.QtGui import QFont
-from collections import deque
 from functools import partial
 from datetime import timedelta, datetime
 import pyqtgraph as pg
-import numpy as np
 import logging
 import time
 
 # Local imports
 from lattice.devices.source import Source
 from lattice.gui.widgets import InputModalWidget
-from lattice.utils import START_TIME, duration_to_str
+from lattice.utils import START_TIME, duration_to_str, RingBuffer
 from lattice.utils.config import AppConfig
 from .source_control_widget import SourceControlWidget
 
@@ -47,13 +45,13 @@ class SourceTab(QWidget):
         self.process_variable_data = {}
         self.working_setpoint_data = {}
         for source in self.sources:
-            self.process_variable_data[source] = deque(maxlen=7200) # 3 hours of data at default polling rate of 500ms
-            self.working_setpoint_data[source] = deque(maxlen=7200)
+            self.process_variable_data[source] = RingBuffer(maxlen=7200) # 3 hours of data at default polling rate of 500ms
+            self.working_setpoint_data[source] = RingBuffer(maxlen=7200)
 
-        # Connect source process variable and working setpoint changes to data handling
-        for source in self.sources:
-            source.process_variable_changed.connect(lambda pv, s=source: self.on_new_process_variable(pv, s))
-            source.working_setpoint_changed.connect(lambda wsp, s=source: self.on_new_working_setpoint(wsp, s))
+        # Sources with samples not yet handed to their curves
+        self.process_variable_dirty: set[Source] = set()
+        self.working_setpoint_dirty: set[Source] = set()
+        self.max_time = 0 # Latest plotted timestamp, to scale x axis
             
         #########################
         # CONTROL WIDGET CONFIG #
@@ -83,6 +81,7 @@ class SourceTab(QWidget):
         
         # Create the source control widgets
         self.control_widgets: list[SourceControlWidget] = []
+        self.control_widgets_by_source: dict[Source, SourceControlWidget] = {}
 
         # Load config colors
         config_colors = AppConfig.THEME['source_tab']['colors']
@@ -108,27 +107,25 @@ class SourceTab(QWidget):
             controls.set_setpoint.connect(source.set_setpoint)
             controls.set_rate_limit.connect(source.set_rate_limit)
             
-            # Connect variable displays
-            source.process_variable_changed.connect(
-                controls.update_process_variable
-            )
+            # Connect variable displays, process variable and working setpoint
+            # are displayed and stored through a single slot each
+            source.process_variable_changed.connect(self.on_new_process_variable)
             source.setpoint_changed.connect(
                 controls.update_setpoint
             )
-            source.working_setpoint_changed.connect(
-                controls.update_working_setpoint
-            )
+            source.working_setpoint_changed.connect(self.on_new_working_setpoint)
             source.rate_limit_changed.connect(
                 controls.update_rate_limit
             )
 
             # Connect working setpoint curve visibility checkboxes
             controls.plot_working_setpoint.stateChanged.connect(
-                lambda state, source=source: self.working_setpoint_curves[source].setVisible(bool(state))
+                partial(self.on_working_setpoint_toggled, source)
             )
 
             # Add controls to controls
             self.control_widgets.append(controls)
+            self.control_widgets_by_source[source] = controls
         
         ######################
         # PLOT WIDGET CONFIG #
@@ -141,16 +138,19 @@ class SourceTab(QWidget):
         self.data_plot.enableAutoRange(axis='y', enable=True)
         self.data_plot.setXRange(0, 30)
         
-        # Create curves
+        # Create curves, samples are always finite so connect='all' skips
+        # the per-update scan for NaN/inf that connect='auto' does
         self.process_variable_curves: dict[Source, pg.PlotCurveItem] = {}
         self.working_setpoint_curves: dict[Source, pg.PlotCurveItem] = {}
         for source in self.sources:
-            self.process_variable_curves[source] = self.data_plot.plot(pen=pg.mkPen(self.colors[source], width=2))
-            self.working_setpoint_curves[source] = self.data_plot.plot(pen=pg.mkPen(self.colors[source], width=2, style=Qt.DashLine))
+            self.process_variable_curves[source] = self.data_plot.plot(pen=pg.mkPen(self.colors[source], width=2), connect='all')
+            self.working_setpoint_curves[source] = self.data_plot.plot(pen=pg.mkPen(self.colors[source], width=2, style=Qt.DashLine), connect='all')
         
-        # Clip rendered data to only what is currently visible
+        # Clip rendered data to only what is currently visible, and reduce it
+        # to min/max pairs when there are more samples than pixels
         for curve in list(self.process_variable_curves.values()) + list(self.working_setpoint_curves.values()):
             curve.setClipToView(True)
+            curve.setDownsampling(auto=True, method='peak')
         
         # Hide working setpoint curves by default
         for curve in list(self.working_setpoint_curves.values()):
@@ -167,12 +167,28 @@ class SourceTab(QWidget):
         self.cursor_line.hide()
         self.cursor_label.hide()
         
+        # Cache view box geometry for the cursor, it only changes on pan/zoom/resize
+        view_box = self.data_plot.plotItem.vb
+        self._view_range = view_box.viewRange()
+        self._view_scene_rect = view_box.sceneBoundingRect()
+        view_box.sigRangeChanged.connect(self._on_view_changed)
+        view_box.sigResized.connect(self._on_view_changed)
+        
         # Connect mouse tracking
         self._last_mouse_scene_pos = None
         self.data_plot.scene().sigMouseMoved.connect(self._on_mouse_moved)
+        
+        # Mouse moves arrive far faster than the cursor needs redrawing,
+        # only the latest position is drawn once the timer fires
+        self.cursor_update_timer = QTimer()
+        self.cursor_update_timer.setSingleShot(True)
+        self.cursor_update_timer.setTimerType(Qt.CoarseTimer) # Display only
+        self.cursor_update_timer.setInterval(30)
+        self.cursor_update_timer.timeout.connect(self.update_cursor)
             
         # Start timer to update source data plot
         self.plot_update_timer = QTimer()
+        self.plot_update_timer.setTimerType(Qt.CoarseTimer) # Display only
         self.plot_update_timer.timeout.connect(self.update_data_plot)
         self.plot_update_timer.start(1000)
 
@@ -182,6 +198,10 @@ class SourceTab(QWidget):
         self.time_lock_input = QSpinBox(minimum=0, maximum=100000, value=30)
         self.time_lock_input.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
         self.time_lock_input.setAlignment(Qt.AlignmentFlag.AlignRight)
+        
+        # Apply time window changes without waiting for new data
+        self.time_lock_checkbox.toggled.connect(self.on_time_window_changed)
+        self.time_lock_input.valueChanged.connect(self.on_time_window_changed)
 
         #################
         # LAYOUT WIGETS #
@@ -241,11 +261,29 @@ class SourceTab(QWidget):
     # SOURCE METHODS #
     ##################
 
-    def on_new_process_variable(self, pv: float, source: Source):
-        self.process_variable_data[source].append((time.monotonic() - START_TIME, pv))
+    @Slot(float)
+    def on_new_process_variable(self, pv: float):
+        source: Source = self.sender()
+        self.control_widgets_by_source[source].update_process_variable(pv)
+        self.process_variable_data[source].append(time.monotonic() - START_TIME, pv)
+        self.process_variable_dirty.add(source)
+        
+    @Slot(float)
+    def on_new_working_setpoint(self, wsp: float):
+        source: Source = self.sender()
+        self.control_widgets_by_source[source].update_working_setpoint(wsp)
+        self.working_setpoint_data[source].append(time.monotonic() - START_TIME, wsp)
         
-    def on_new_working_setpoint(self, wsp: float, source: Source):
-        self.working_setpoint_data[source].append((time.monotonic() - START_TIME, wsp))
+        # Hidden curves are caught up when they are shown
+        if self.working_setpoint_curves[source].isVisible():
+            self.working_setpoint_dirty.add(source)
+        
+    def on_working_setpoint_toggled(self, source: Source, state: int):
+        visible = bool(state)
+        self.working_setpoint_curves[source].setVisible(visible)
+        if visible and self.working_setpoint_data[source]:
+            self.working_setpoint_dirty.add(source)
+            self.update_data_plot()
     
     def open_pid_input_modal(self, source: Source):
         pid_input_settings = ["PB", "TI", "TD"] # TODO: Ask what these should be
@@ -312,15 +350,12 @@ class SourceTab(QWidget):
             # Save changes to config since safety settings are not stored on-device
             # Ensure source entry exists
             logger.debug(AppConfig.PARAMETER)
-            if source.name not in AppConfig.PARAMETER['sources']['safety']:
-                AppConfig.PARAMETER['sources']['safety'][source.name] = {}
-                
-            config = AppConfig.PARAMETER['sources']['safety'][source.name]
-            config["from"] = safe_from
-            config["to"] = safe_to
-            config["rate_limit"] = safe_rate_limit
-            config["max_setpoint"] = max_sp
-            config["stability_tolerance"] = stability_tolerance
+            safety_config = AppConfig.PARAMETER['sources']['safety'].setdefault(source.name, {})
+            safety_config["from"] = safe_from
+            safety_config["to"] = safe_to
+            safety_config["rate_limit"] = safe_rate_limit
+            safety_config["max_setpoint"] = max_sp
+            safety_config["stability_tolerance"] = stability_tolerance
             AppConfig.PARAMETER.save()
         
         # On cancellation
@@ -335,35 +370,55 @@ class SourceTab(QWidget):
         AppConfig.THEME['source_tab']['colors'] = list(self.colors.values())
         AppConfig.THEME.save()
 
+    @Slot()
     def update_data_plot(self):
-        # Update the plot with new full dataset
-        max_time = 0 # To scale x axis later
+        # Only update curves that received samples since the last tick
+        if not self.process_variable_dirty and not self.working_setpoint_dirty:
+            return
+        
+        # Find the latest sample first, when the time window is locked only
+        # the samples inside it are handed to the curves
+        for source in self.process_variable_dirty:
+            self.max_time = max(self.max_time, self.process_variable_data[source].last_timestamp())
+        for source in self.working_setpoint_dirty:
+            self.max_time = max(self.max_time, self.working_setpoint_data[source].last_timestamp())
+        since = None
+        if self.time_lock_checkbox.isChecked():
+            since = self.max_time - self.time_lock_input.value()
         
         # Handle process variable data
-        for source in self.sources:
-            if self.process_variable_data[source]:
-                timestamps, values = zip(*self.process_variable_data[source])
-                if timestamps[-1] > max_time:
-                    max_time = timestamps[-1]
-                self.process_variable_curves[source].setData(
-                    np.array(timestamps),
-                    np.array(values)
-                )
+        for source in self.process_variable_dirty:
+            data = self.process_variable_data[source]
+            self.process_variable_curves[source].setData(*data.snapshot(since))
+        self.process_variable_dirty.clear()
         
         # Handle working setpoint data
+        for source in self.working_setpoint_dirty:
+            data = self.working_setpoint_data[source]
+            self.working_setpoint_curves[source].setData(*data.snapshot(since))
+        self.working_setpoint_dirty.clear()
+
+        self.update_x_range()
+
+    @Slot()
+    def on_time_window_changed(self):
+        # Curves only hold the samples inside the locked window, so hand
+        # every shown curve its data again for the new window
         for source in self.sources:
-            curve = self.working_setpoint_curves[source]
-            
-            if curve.isVisible() and self.working_setpoint_data[source]:
-                timestamps, values = zip(*self.working_setpoint_data[source])
-                if timestamps[-1] > max_time:
-                    max_time = timestamps[-1]
-                curve.setData(
-                    np.array(timestamps),
-                    np.array(values)
-                )
+            if self.process_variable_data[source]:
+                self.process_variable_dirty.add(source)
+            if self.working_setpoint_data[source] and self.working_setpoint_curves[source].isVisible():
+                self.working_setpoint_dirty.add(source)
+        
+        if self.process_variable_dirty or self.working_setpoint_dirty:
+            self.update_data_plot()
+        else:
+            self.update_x_range()
 
+    @Slot()
+    def update_x_range(self):
         # Optional: auto-scroll x-axis
+        max_time = self.max_time
         time_delta = self.time_lock_input.value()
         if self.time_lock_checkbox.isChecked():
             # Show last time_delta seconds
@@ -376,9 +431,22 @@ class SourceTab(QWidget):
             if self._last_mouse_scene_pos is not None:
                 self._update_cursor_from_scene_pos(self._last_mouse_scene_pos)
                 
+    @Slot()
+    def _on_view_changed(self):
+        view_box = self.data_plot.plotItem.vb
+        self._view_range = view_box.viewRange()
+        self._view_scene_rect = view_box.sceneBoundingRect()
+        
+    @Slot(object)
     def _on_mouse_moved(self, pos):
         self._last_mouse_scene_pos = pos
-        self._update_cursor_from_scene_pos(pos)
+        if not self.cursor_update_timer.isActive():
+            self.cursor_update_timer.start()
+            
+    @Slot()
+    def update_cursor(self):
+        if self._last_mouse_scene_pos is not None:
+            self._update_cursor_from_scene_pos(self._last_mouse_scene_pos)
         
     def _update_cursor_from_scene_pos(self, pos):
         """Track mouse location and show cursor line in the source plot."""
@@ -388,13 +456,11 @@ class SourceTab(QWidget):
         self.cursor_label.hide()
 
         # Check if plot is currently under the mouse
-        if not self.data_plot.plotItem.vb.sceneBoundingRect().contains(pos):
+        if not self._view_scene_rect.contains(pos):
             return
 
-        target_vb = self.data_plot.plotItem.vb
-        
         # Convert scene → data coords
-        mouse_point = target_vb.mapSceneToView(pos)
+        mouse_point = self.data_plot.plotItem.vb.mapSceneToView(pos)
         x = mouse_point.x()
 
         self.cursor_line.setPos(x)
@@ -403,7 +469,7 @@ class SourceTab(QWidget):
         # Label at top of plot
         time_str = duration_to_str(x)
 
-        (xmin, xmax), (_, ymax) = target_vb.viewRange()
+        (xmin, xmax), (_, ymax) = self._view_range
         self.cursor_label.setText(f"t = {time_str}")
 
         if x > xmax - ((xmax - xmin) * 0.014 * len(time_str)): # rough estimate of right border
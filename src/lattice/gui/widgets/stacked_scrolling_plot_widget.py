@@ -3,30 +3,24 @@ from PySide6.QtCore import QThread
 import pyqtgraph as pg
 import numpy as np
 import logging
-from collections import deque
 
 # Local imports
-from lattice.utils import duration_to_str
+from lattice.utils import elapsed_to_str, RingBuffer
 
 logger = logging.getLogger(__name__)
 
 # Custom axis for scientific notation in plots
 class ScientificAxis(pg.AxisItem):
     def tickStrings(self, values, scale, spacing):
-        return [duration_to_str(v) for v in values]
+        return np.char.mod("%.2e", values).tolist()
     
 # Custom axis for time in plots
 class TimeAxis(pg.AxisItem):
     def tickStrings(self, values, scale, spacing):
-        def format_time(total_seconds):
-            minutes, seconds = divmod(total_seconds, 60)
-            hours, minutes = divmod(minutes, 60)
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        
-        return [format_time(int(v)) for v in values]
+        return [elapsed_to_str(int(v)) for v in values]
 
 class StackedScrollingPlotWidget(pg.GraphicsLayoutWidget):
-    def __init__(self, names: list[str], data_dict: list[deque[(float, float)]], colors: list[str]):
+    def __init__(self, names: list[str], data_dict: dict[object, RingBuffer], colors: list[str]):
         super().__init__()
         
         if len(colors) < len(data_dict):
@@ -38,12 +32,18 @@ class StackedScrollingPlotWidget(pg.GraphicsLayoutWidget):
         self.data_dict = data_dict
         self.colors = colors
         
-        # Create curves
+        # Create curves, readings are always finite so the NaN/inf scan is skipped
         self.curves = [
-            pg.PlotCurveItem(pen=pg.mkPen(self.colors[i], width=2))
-            for i in range(len(data_dict))
+            pg.PlotCurveItem(pen=pg.mkPen(color, width=2), skipFiniteCheck=True)
+            for color in self.colors[:len(data_dict)]
         ]
         
+        # Latest timestamp handed to each curve, curves without new samples
+        # are not re-set unless the time window changes
+        self.plotted_timestamps = [None] * len(self.curves)
+        self.plotted_time_delta = None
+        self.x_range = None # Last range applied by update_data
+        
         # Set starting row
         row = 0
         
@@ -59,9 +59,9 @@ class StackedScrollingPlotWidget(pg.GraphicsLayoutWidget):
         self.combined_plot.setClipToView(True)
         self.combined_plot.setAutoVisible(x=True, y=True)
         
-        # Create stacked plots and add to layout with delimiters
+        # Create stacked plots and add to layout, all plots share the
+        # GraphicsLayoutWidget scene so no separate delimiter items are needed
         self.stacked_plots = []
-        self.delimiters = []
         for _ in range(len(self.curves)):
             self.stacked_plots.append(self.addPlot(row=row, col=0))
             row += 1
@@ -88,28 +88,38 @@ class StackedScrollingPlotWidget(pg.GraphicsLayoutWidget):
         self._update_plot_display()
         
     def update_data(self, time_delta: int = None):
-        # Update the plot with new full dataset
-        max_time = 0 # To scale x axis later
-        for i, data in enumerate(self.data_dict.values()):
-            if data:
-                arr = np.array(data)
-                timestamps = arr[:, 0]
-                values = arr[:, 1]
-                
-                self.curves[i].setData(timestamps, values)
-                
-                if timestamps[-1] > max_time:
-                    max_time = timestamps[-1]
+        # Find the latest sample first, when the time window is locked only
+        # the samples inside it are handed to the curves
+        max_time = max(
+            (data.last_timestamp() for data in self.data_dict.values() if data),
+            default=0
+        )
+        since = max_time - time_delta if time_delta else None
+        
+        if time_delta != self.plotted_time_delta:
+            self.plotted_timestamps = [None] * len(self.curves)
+            self.plotted_time_delta = time_delta
+        
+        for i, (curve, data) in enumerate(zip(self.curves, self.data_dict.values())):
+            if not data:
+                continue
+            last_timestamp = data.last_timestamp()
+            if last_timestamp == self.plotted_timestamps[i]:
+                continue
+            self.plotted_timestamps[i] = last_timestamp
+            curve.setData(*data.snapshot(since))
 
         # Optional: auto-scroll x-axis
         if time_delta:
             # Show last time_delta seconds
-            if max_time >= time_delta:
-                self.combined_plot.setXRange(max(0, max_time - time_delta), max_time)
-                self.stacked_plots[0].setXRange(max(0, max_time - time_delta), max_time)
-            else:
-                self.combined_plot.setXRange(max(0, max_time - time_delta), time_delta)
-                self.stacked_plots[0].setXRange(max(0, max_time - time_delta), time_delta)
+            x_min = max(0, max_time - time_delta)
+            x_max = max(max_time, time_delta)
+            if (x_min, x_max) != self.x_range:
+                self.x_range = (x_min, x_max)
+                self.combined_plot.setXRange(x_min, x_max)
+                self.stacked_plots[0].setXRange(x_min, x_max)
+        else:
+            self.x_range = None # User may pan freely, re-apply once locked again
     
     def _update_plot_display(self):
         # Set visibility of combined plot
@@ -160,7 +170,6 @@ if __name__ == '__main__':
     from PySide6.QtCore import QTimer
     import random
     import time
-    from collections import deque
 
     app = QApplication(sys.argv)
 
@@ -168,7 +177,7 @@ if __name__ == '__main__':
     n_signals = 3
     names = [f"Signal {i+1}" for i in range(n_signals)]
     colors = ['r', 'g', 'c']
-    data = {i: deque(maxlen=200) for i in range(n_signals)}
+    data = {i: RingBuffer(maxlen=200) for i in range(n_signals)}
 
     # ---- Main Widget ----
     main_widget = QWidget()
@@ -211,7 +220,7 @@ if __name__ == '__main__':
             time_delta = 10  # fallback to default
         for i in range(n_signals):
             val = random.uniform(-1, 1) * (i + 1)
-            data[i].append((t, val))
+            data[i].append(t, val)
         plot_widget.update_data(time_delta=time_delta)
 
     timer = QTimer()
@@ -1,3 +1,5 @@
+import importlib
+import logging
 import sys
 import traceback
 from PySide6.QtWidgets import (
@@ -9,11 +11,12 @@ from PySide6.QtWidgets import (
     QLabel,
     QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
-# Local imports
-from lattice.app import MainAppWindow
-from lattice.configurator import ConfiguratorWindow
+logger = logging.getLogger(__name__)
+
+# Imported while the chooser is open so the chosen window opens quickly
+PREIMPORT_MODULES = ("lattice.app", "lattice.configurator")
 
 class ModeChooser(QDialog):
     def __init__(self):
@@ -41,6 +44,15 @@ class ModeChooser(QDialog):
         layout.addWidget(btn_launch)
 
         self.setLayout(layout)
+        self._preimport_scheduled = False
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        # Wait for the first paint so the chooser is not shown blank
+        # while pyqtgraph, numpy, devices, ... load
+        if not self._preimport_scheduled:
+            self._preimport_scheduled = True
+            QTimer.singleShot(0, _preimport)
 
     def chosen_mode(self):
         if self.radio_config.isChecked():
@@ -48,6 +60,16 @@ class ModeChooser(QDialog):
         return "main"
 
 
+def _preimport():
+    # Runs on the GUI thread, the modules create QObjects (event filters)
+    # at import time that must live there
+    for name in PREIMPORT_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            logger.exception(f"Failed to preimport {name}")
+
+
 def start():
     try:
         app = QApplication(sys.argv)
@@ -58,8 +80,10 @@ def start():
 
         mode = chooser.chosen_mode()
         if mode == "main":
+            from lattice.app import MainAppWindow
             window = MainAppWindow()
         else:
+            from lattice.configurator import ConfiguratorWindow
             window = ConfiguratorWindow()
         window.show()
 
@@ -2,11 +2,13 @@ from .recipe import *
 from .email_alerter import EmailAlerter
 from .timing import *
 from .config import AppConfig, Config
+from .ring_buffer import RingBuffer
 
 __all__ = [
     "recipe",
     "timing",
-    "EmailAlerter"
-    "Config"
-    "AppConfig"
+    "EmailAlerter",
+    "Config",
+    "AppConfig",
+    "RingBuffer"
 ]
\ No newline at end of file
@@ -4,6 +4,12 @@ import yaml
 import platform
 from pathlib import Path
 
+# Prefer the LibYAML backed C implementations when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 logger = logging.getLogger(__name__)
 
 APP_NAME = 'lattice'
@@ -14,7 +20,7 @@ class Config:
         self.data = None
         if os.path.exists(self._path):
             with open(self._path, 'r') as f:
-                yaml_data = yaml.safe_load(f)
+                yaml_data = yaml.load(f, Loader=SafeLoader)
                 if yaml_data is not None:
                     self.data = yaml_data
 
@@ -24,24 +30,28 @@ class Config:
             return
 
         def copy_missing_keys(dict1, dict2):
+            changed = False
             for key in dict1.keys():
                 if key not in dict2.keys():
                     dict2[key] = dict1[key]
+                    changed = True
                     continue
 
                 if isinstance(dict1[key], dict) and isinstance(dict2[key], dict):
                     if dict1[key]:
-                        copy_missing_keys(dict1[key], dict2[key])
+                        changed |= copy_missing_keys(dict1[key], dict2[key])
+            return changed
 
-        copy_missing_keys(default, self.data)
-        self.save()
+        # Only rewrite the file when defaults were added to it
+        if copy_missing_keys(default, self.data):
+            self.save()
 
     def save(self):
         # Ensure parent "config" directory exists
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
         with self._path.open("w") as f:
-            yaml.safe_dump(self.data, f)
+            yaml.dump(self.data, f, Dumper=SafeDumper)
 
     def __getitem__(self, key):
         return self.data[key]
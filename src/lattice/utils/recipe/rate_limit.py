@@ -25,12 +25,12 @@ class RateLimitAction(RecipeAction):
         values = self.gather_values(recipe_table, row)
         for value in values:
             try:
-                float(value)
+                rate_limit = float(value)
             except (ValueError, TypeError):
                 logger.error(f"{value} is an invalid value.")
                 return False
             
-            if float(value) <= 0:
+            if rate_limit <= 0:
                 logger.error(f"{value} is invalid. Rate limit cannot be 0 or negative.")
                 return False
         
@@ -25,16 +25,16 @@ class SetpointAction(RecipeAction):
         values_dict = self.gather_values_dict(recipe_table, row)
         for source_name, value in values_dict.items():
             try:
-                float(value)
+                setpoint = float(value)
             except (ValueError, TypeError):
                 logger.error(f"{value} is an invalid value.")
                 return False
             
-            if float(value) < 0:
+            if setpoint < 0:
                 logger.error(f"{value} is invalid. Setpoint cannot be negative.")
                 return False
             
-            if float(value) > self.sources[source_name].get_max_setpoint():
+            if setpoint > self.sources[source_name].get_max_setpoint():
                 logger.error(f"{value} is invalid. Setpoint exceeds max setpoint safety")
                 return False
         
@@ -13,9 +13,14 @@ class WaitUntilSetpointAction(WaitAction):
     def __init__(self, source_dict: dict[str, Source]):
         super().__init__()
         self.sources = source_dict
-        self.check_interval_ms = 500
+        self.connected_sources: list[Source] = []
+        
+        # Checks are driven by process_variable_changed, the timer is
+        # only a fallback in case a source stops reporting changes
+        self.check_interval_ms = 5000
         self.check_timer = QTimer()
         self.check_timer.timeout.connect(self._check)
+        self.check_on_start = True
         
     def run(self, recipe_table: QTableWidget, row: int):
         self.sources_finished = set()
@@ -29,55 +34,90 @@ class WaitUntilSetpointAction(WaitAction):
         values_dict = self.gather_values_dict(recipe_table, row)
         for source_name, value in values_dict.items():
             if value is not None:
+                setpoint = float(value)
                 self.previous_setpoints[source_name] = self.sources[source_name].get_setpoint()
-                self.target_setpoints[source_name] = float(value)
-                self.sources[source_name].set_setpoint(float(value))
+                self.target_setpoints[source_name] = setpoint
+                self.sources[source_name].set_setpoint(setpoint)
                 self.sources_checking.add(source_name)
         
+        self._connect_sources()
         self.check_timer.start(self.check_interval_ms)
+        # Check once now, the targets may already be met and the timer
+        # is only a fallback for sources that stop emitting
+        if self.check_on_start:
+            self._check()
     
     def validate(self, recipe_table: QTableWidget, row: int):
         values_dict = self.gather_values_dict(recipe_table, row)
         for source_name, value in values_dict.items():
             try:
-                float(value)
+                setpoint = float(value)
             except (ValueError, TypeError):
                 logger.error(f"{value} is an invalid value.")
                 return False
             
-            if float(value) < 0:
+            if setpoint < 0:
                 logger.error(f"{value} is invalid. Setpoint cannot be negative.")
                 return False
             
-            if float(value) > self.sources[source_name].get_max_setpoint():
+            if setpoint > self.sources[source_name].get_max_setpoint():
                 logger.error(f"{value} is invalid. Setpoint exceeds max setpoint safety")
                 return False
         
         return True
     
     def pause(self):
+        self._disconnect_sources()
         if self.check_timer.isActive():
             self.check_timer.stop()
     
     def resume(self):
+        self._connect_sources()
         if not self.check_timer.isActive():
             self.check_timer.start(self.check_interval_ms)
     
     def stop(self):
+        self._disconnect_sources()
         if self.check_timer.isActive():
             self.check_timer.stop()
+            
+    def _finish(self):
+        # Stop listening before continuing, the next step may run this action again
+        self._disconnect_sources()
+        self.check_timer.stop()
+        self.can_continue.emit()
     
-    def _check(self):
-        if self.sources_checking == self.sources_finished:
-            self.can_continue.emit()
-            self.check_timer.stop()
-            return
-        
+    def _connect_sources(self):
         for source_name in self.sources_checking:
+            source = self.sources[source_name]
+            if source not in self.connected_sources:
+                self._check_signal(source).connect(self._on_source_changed)
+                self.connected_sources.append(source)
+    
+    def _disconnect_sources(self):
+        for source in self.connected_sources:
+            self._check_signal(source).disconnect(self._on_source_changed)
+        self.connected_sources = []
+    
+    def _check_signal(self, source: Source):
+        """
+        Returns the source signal that triggers a check
+        """
+        return source.process_variable_changed
+    
+    def _on_source_changed(self, value):
+        self._check()
+    
+    def _check(self):
+        # Sources that already passed their target are not checked again
+        for source_name in self.sources_checking - self.sources_finished:
             previous = self.previous_setpoints[source_name]
             target = self.target_setpoints[source_name]
             process_variable = self.sources[source_name].get_process_variable()
             
             # Perform sign comparison to check if target has been "passed"
             if (process_variable - target) * (previous - target) < 0:
-                self.sources_finished.add(source_name)
\ No newline at end of file
+                self.sources_finished.add(source_name)
+        
+        if self.sources_checking == self.sources_finished:
+            self._finish()
\ No newline at end of file
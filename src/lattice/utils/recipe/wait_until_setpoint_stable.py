@@ -12,14 +12,26 @@ class WaitUntilSetpointStableAction(WaitUntilSetpointAction):
     def __init__(self, source_dict: dict[str, Source]):
         super().__init__(source_dict)
         
+        # Stability changes without the process variable changing,
+        # so keep polling at the original rate
+        self.check_interval_ms = 500
+        
+        # The close and stable flags still describe the previous setpoint
+        # until the source has been polled, so never check before that
+        self.check_on_start = False
+        
         # Reconnect timer to subclass version of _check
         self.check_timer.timeout.disconnect()
         self.check_timer.timeout.connect(self._check)
+    
+    def _check_signal(self, source: Source):
+        # The worker emits the process variable before it updates the
+        # close flag, so check when the flag itself is reported
+        return source.is_pv_close_to_sp_changed
         
     def _check(self):
         if self.sources_checking == self.sources_finished:
-            self.can_continue.emit()
-            self.check_timer.stop()
+            self._finish()
             return
         
         for source_name in self.sources_checking:
@@ -0,0 +1,52 @@
+import numpy as np
+
+class RingBuffer:
+    """
+    Fixed length (timestamp, value) buffer backed by preallocated float64 arrays.
+    Once full, the oldest samples are overwritten.
+
+    The arrays are twice maxlen and every sample is written to both halves, so
+    the most recent samples are always one contiguous slice and can be read
+    with a single copy, no reordering needed.
+    """
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.timestamps = np.empty(2 * maxlen, dtype=np.float64)
+        self.values = np.empty(2 * maxlen, dtype=np.float64)
+        self.head = 0 # Index the next sample is written to
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, timestamp: float, value: float):
+        head = self.head
+        shadow = head + self.maxlen
+        self.timestamps[head] = self.timestamps[shadow] = timestamp
+        self.values[head] = self.values[shadow] = value
+
+        self.head = (head + 1) % self.maxlen
+        if self.count < self.maxlen:
+            self.count += 1
+
+    def snapshot(self, since: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns copies of timestamps and values in chronological order.
+        Copies are needed because plot items keep the arrays they are given,
+        and appends overwrite the buffer in place.
+
+        If since is given, samples older than the last one at or before
+        since are left out, so a line drawn through them still reaches since.
+        """
+        start = (self.head - self.count) % self.maxlen
+        end = start + self.count
+        if since is not None:
+            index = np.searchsorted(self.timestamps[start:end], since, side='right')
+            start += max(int(index) - 1, 0)
+        return self.timestamps[start:end].copy(), self.values[start:end].copy()
+
+    def last_timestamp(self) -> float | None:
+        if self.count == 0:
+            return None
+        return float(self.timestamps[self.head - 1])
@@ -1,5 +1,7 @@
+import math
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from lattice.utils.config import AppConfig
 
 START_TIME = time.monotonic()
@@ -13,7 +15,12 @@ def duration_to_str(total_seconds: int):
         dt = now - timedelta(seconds=uptime_seconds()) + timedelta(seconds=total_seconds)
         return dt.strftime("%H:%M:%S")
         
-    hours = int(total_seconds // 3600)
-    minutes = int((total_seconds % 3600) // 60)
-    seconds = int(total_seconds % 60)
+    # Plot ticks and cursor labels keep landing on the same whole seconds
+    return elapsed_to_str(math.floor(total_seconds))
+
+@lru_cache(maxsize=4096)
+def elapsed_to_str(total_seconds: int) -> str:
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
     return f"{hours:02}:{minutes:02}:{seconds:02}"
\ No newline at end of file